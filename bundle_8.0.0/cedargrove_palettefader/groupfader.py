@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`groupfader`
+================================================================================
+
+GroupFader is a CircuitPython driver class for brightness-adjusting the colors
+of every object in a displayio group. The group is examined once when the
+GroupFader is instantiated; the palettes of labels, display_shapes, vectorio
+shapes, and palette-based TileGrids (including those in nested groups) are
+registered with a PaletteFaderGroup that adjusts them in place.
+
+Objects added to the group after instantiation are not adjusted; create a new
+GroupFader after changing the group's structure.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  <https://circuitpython.org/downloads>
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Palette_Fader.git"
+
+import displayio
+from cedargrove_palettefader.palettefader import PaletteFaderGroup
+
+
+class GroupFader(PaletteFaderGroup):
+    """Displayio group fader with normalization, brightness (fading), and gamma
+    control. Adjusts the palettes of the group's objects in place."""
+
+    def __init__(self, group, brightness=1.0, gamma=1.0, normalize=False):
+        """Instantiate the group fader. The current colors of the group's
+        objects are used as the reference colors.
+
+        :param displayio.Group group: The displayio group to adjust. No default.
+        :param float brightness: The brightness value for color adjustment.
+          Value range is 0.0 to 1.0. Default is 1.0 (maximum brightness).
+        :param float gamma: The gamma value for color adjustment. Value range
+          is 0.0 to 2.0. Default is 1.0 (no gamma adjustment).
+        :param bool normalize: The boolean normalization state. True to
+          normalize all colors of the group together; False to skip
+          normalization. Default is False (no normalization)."""
+        super().__init__(brightness)
+        self._gamma = gamma
+
+        palettes = []
+        self._map_group(group, palettes)
+        for palette in palettes:
+            self.add(palette, gamma, target=palette)
+
+        if normalize and self._ref_colors:
+            # Normalize to the brightest RGB component of the whole group
+            norm_base = 0xFF / (max(self._ref_colors) or 0xFF)
+            for segment in self._segments:
+                segment[2] = norm_base
+            self.fade_normalize()
+
+    @property
+    def gamma(self):
+        """The group's gamma value, typically from 0.0 to 2.0."""
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, new_gamma):
+        if self._gamma != new_gamma:
+            self._gamma = new_gamma
+            for segment in self._segments:
+                segment[3] = new_gamma
+            self.fade_normalize()
+
+    def _map_group(self, group, palettes):
+        """Record the palette of each object in a group and its nested groups.
+
+        :param displayio.Group group: The group to examine.
+        :param list palettes: The palettes already recorded."""
+        # pylint: disable=protected-access
+        for item in group:
+            if hasattr(item, "_palette"):
+                # A displayio display_shapes or label object
+                palette = item._palette
+            elif isinstance(item, displayio.Group):
+                self._map_group(item, palettes)
+                continue
+            else:
+                # A bitmap or vectorio object
+                palette = getattr(item, "pixel_shader", None)
+
+            if not isinstance(palette, displayio.Palette):
+                continue
+            if any(palette is mapped for mapped in palettes):
+                # A shared palette is adjusted once
+                continue
+            palettes.append(palette)
@@ -15,6 +15,19 @@ color list.
 For adjusting a single color value, create a list containing a single color or
 use cedargrove_unit_converter.color.colorfader.color_fader().
 
+Brightness, normalization, and gamma are applied through a 256-entry channel
+lookup table when the palette has enough colors to make the table worthwhile;
+the colors of smaller palettes are adjusted directly. Tables for brightness
+levels in 1/CACHE_STEPS increments are cached so that repeated changes between
+those levels only require three table lookups per palette color; tables for
+other levels are built as needed. An optional per-palette cache of adjusted
+colors, keyed on quantized brightness and gamma, skips the adjustment entirely
+when returning to a recently used level.
+
+PaletteFaderGroup adjusts several palettes together from one contiguous buffer
+of reference colors. PaletteFader holds its reference colors in a one-palette
+PaletteFaderGroup.
+
 cedargrove_palettefader_mp.py v2.0.1 2022-10-02
 
 * Author(s): JG for Cedar Grove Maker Studios
@@ -36,12 +49,106 @@ __repo__ = "https://github.com/CedarGroveStudios/Palette_Fader.git"
 
 import displayio
 
+# Maximum number of channel lookup tables retained for reuse (256 bytes each)
+LUT_CACHE_SIZE = 16
+
+# Brightness quantization steps of the cached channel lookup tables and the
+#   adjusted palette cache
+CACHE_STEPS = 64
+
+# Palettes with fewer channel values than a lookup table are adjusted directly
+LUT_SIZE = 256
+
+_lut_cache = {}
+_lut_cache_keys = []  # Least recently used key is first
+
+
+def _cache_get(cache, keys, key):
+    """Return a cached value and mark it most recently used; None if the key
+    is not cached.
+
+    :param dict cache: The cached values.
+    :param list keys: The cache keys; the least recently used key is first.
+    :param key: The key of the value."""
+    value = cache.get(key)
+    if value is not None:
+        keys.remove(key)
+        keys.append(key)
+    return value
+
+
+def _cache_put(cache, keys, key, value, size):
+    """Add a value to a cache, discarding the least recently used value if
+    the cache is full.
+
+    :param dict cache: The cached values.
+    :param list keys: The cache keys; the least recently used key is first.
+    :param key: The key of the value.
+    :param value: The value to cache.
+    :param int size: The maximum number of cached values."""
+    if len(keys) >= size:
+        del cache[keys.pop(0)]
+    cache[key] = value
+    keys.append(key)
+
+
+def _channel_lut(norm_base, brightness, gamma):
+    """Return a 256-entry channel lookup table for a normalization base,
+    brightness, and gamma value. The table for a brightness level in
+    1/CACHE_STEPS increments is retrieved from the cache if recently used;
+    otherwise it is built and cached, and the least recently used table is
+    discarded. Tables for other brightness values are not cached.
+
+    :param float norm_base: The normalization factor at full brightness.
+    :param float brightness: The brightness value for palette adjustment.
+    :param float gamma: The gamma value for palette adjustment."""
+    key = None
+    level = brightness * CACHE_STEPS
+    if level == int(level):
+        key = (norm_base, int(level), gamma)
+        lut = _cache_get(_lut_cache, _lut_cache_keys, key)
+        if lut is not None:
+            return lut
+
+    factor = round(norm_base * brightness, 3)
+    lut = bytearray(LUT_SIZE)
+    for value in range(LUT_SIZE):
+        lut[value] = int(min((value * factor) ** gamma, 0xFF))
+
+    if key is not None:
+        _cache_put(_lut_cache, _lut_cache_keys, key, lut, LUT_CACHE_SIZE)
+    return lut
+
+
+def _channel_table(values, norm_base, brightness, gamma):
+    """Return a channel table that maps 8-bit channel values to adjusted
+    values. A small palette gets a dict of just its own channel values; a
+    larger palette gets a 256-entry lookup table.
+
+    :param bytes values: The palette's distinct channel values; None for a
+      palette with too many colors to adjust directly.
+    :param float norm_base: The normalization factor at full brightness.
+    :param float brightness: The brightness value for palette adjustment.
+    :param float gamma: The gamma value for palette adjustment."""
+    if values is None:
+        return _channel_lut(norm_base, brightness, gamma)
+    factor = round(norm_base * brightness, 3)
+    return {value: int(min((value * factor) ** gamma, 0xFF)) for value in values}
+
 
 class PaletteFader:
     """Displayio palette fader with normalization, brightness (fading), and
     gamma control. Returns an adjusted displayio palette object."""
 
-    def __init__(self, source_palette, brightness=1.0, gamma=1.0, normalize=False):
+    def __init__(
+        self,
+        source_palette,
+        brightness=1.0,
+        gamma=1.0,
+        normalize=False,
+        in_place=False,
+        cache_size=0,
+    ):
         """Instantiate the palette fader. Creates a displayio palette object
         with faded source palette/List color values. Transparency is preserved.
 
@@ -53,42 +160,39 @@ class PaletteFader:
           is 0.0 to 2.0. Default is 1.0 (no gamma adjustment).
         :param bool normalize: The boolean normalization state. True to
           normalize; False to skip normalization. Default is False (no
-          normalization)."""
+          normalization).
+        :param bool in_place: The boolean palette update mode. True to adjust
+          a single persistent palette in place; False to create a new palette
+          for each adjustment. Default is False (new palette).
+        :param int cache_size: The maximum number of adjusted palettes retained
+          for reuse. Brightness is quantized to 1/CACHE_STEPS increments when
+          the cache is enabled; the least recently used palette is discarded
+          when the cache is full. Default is 0 (no cache)."""
 
         self._src_palette = source_palette
         self._brightness = brightness
         self._gamma = gamma
         self._normalize = normalize
+        self._in_place = in_place
+        self._cache_size = cache_size
 
-        self._list_transparency = []  # List of transparent items in a color list
-
-        self._ref_palette = []
-        # Create the reference palette list with source palette RGB values
-
+        # Bitmask of transparent color indices; one bit per palette color
+        self._transparency = bytearray((len(self._src_palette) + 7) // 8)
         for index, rgb in enumerate(self._src_palette):
-            if rgb is not None:
-                b = rgb & 0x0000FF
-                g = (rgb & 0x00FF00) >> 8
-                r = (rgb & 0xFF0000) >> 16
-                self._ref_palette.append([r, g, b])
-
-                if not isinstance(self._src_palette, list):
-                    # Record palette transparency color index
-                    if self._src_palette.is_transparent(index):
-                        self._list_transparency.append(index)
-            else:
-                """Color is None; replace with BLACK in the reference palette
-                and record the color index in the transparency list."""
-                self._ref_palette[index] = [0, 0, 0]
-                self._list_transparency.append(index)
-
-        # Find the brightest RGB component for the normalization process
-        if self._normalize:
-            self._ref_palette_max = max(max(self._ref_palette))
-        else:
-            # Set the maximum value to the 8-bit limit (no normalization)
-            self._ref_palette_max = 0xFF
-        self.fade_normalize()
+            if rgb is None:
+                # Color is None; record the color index in the bitmask
+                self._transparency[index >> 3] |= 1 << (index & 7)
+            elif not isinstance(self._src_palette, list):
+                # Record palette transparency color index
+                if self._src_palette.is_transparent(index):
+                    self._transparency[index >> 3] |= 1 << (index & 7)
+
+        # The reference colors are held and adjusted by a one-palette group
+        self._faders = PaletteFaderGroup(brightness)
+        self._new_palette = self._faders.add(
+            source_palette, gamma, normalize, cache_size
+        )
+        self._segment = self._faders._segments[0]  # pylint: disable=protected-access
 
     @property
     def brightness(self):
@@ -108,12 +212,31 @@ class PaletteFader:
         brightness-adjusted."""
         return self._gamma
 
+    @gamma.setter
+    def gamma(self, new_gamma):
+        if self._gamma != new_gamma:
+            self._gamma = new_gamma
+            self.fade_normalize()
+
     @property
     def normalize(self):
         """The palette's normalization mode state; True for normalization
         applied; False for no normalization."""
         return self._normalize
 
+    @property
+    def in_place(self):
+        """The palette update mode; True if the adjusted palette is a single
+        persistent palette that is updated in place; False if a new palette is
+        created for each adjustment."""
+        return self._in_place
+
+    @property
+    def cache_size(self):
+        """The maximum number of adjusted palettes retained for reuse; 0 if
+        the cache is disabled."""
+        return self._cache_size
+
     @property
     def palette(self):
         """The adjusted displayio palette."""
@@ -124,27 +247,177 @@ class PaletteFader:
         the current brightness, gamma, and normalize parameters to build the
         adjusted palette. The reference palette is first adjusted for
         brightness and normalization (if enabled) followed by the gamma
-        adjustment. Transparency index values are preserved."""
+        adjustment. Transparency index values are preserved. If in_place is
+        True, the existing adjusted palette is updated rather than replaced.
+        If the cache is enabled, brightness is quantized and a previously
+        adjusted color list is reused when available."""
+        if not self._in_place:
+            # Create a clean new palette with the source transparency
+            self._new_palette = displayio.Palette(len(self._src_palette))
+            for byte_index, bits in enumerate(self._transparency):
+                if bits:
+                    for bit in range(8):
+                        if bits & (1 << bit):
+                            self._new_palette.make_transparent((byte_index << 3) + bit)
+            self._segment[4] = self._new_palette
+        self._segment[3] = self._gamma
+
+        if self._faders.brightness != self._brightness:
+            # Adjusts the palette
+            self._faders.brightness = self._brightness
+        else:
+            self._faders.fade_normalize()
+
+
+class PaletteFaderGroup:
+    """Brightness fader for multiple color lists and displayio palettes. The
+    reference colors of all registered palettes are held in one contiguous
+    buffer and adjusted together in a single pass. Returns an adjusted
+    displayio palette object for each registered palette."""
+
+    def __init__(self, brightness=1.0):
+        """Instantiate the palette fader group.
+
+        :param float brightness: The brightness value for palette adjustment.
+          Value range is 0.0 to 1.0. Default is 1.0 (maximum brightness)."""
+        self._brightness = brightness
 
-        # Determine the normalization factor to apply to the palette
-        self._norm_factor = round((0xFF / self._ref_palette_max) * self._brightness, 3)
+        self._ref_colors = bytearray()  # R, G, B values of all palette colors
+        # [start, end, normalization base, gamma, palette, cache size, cache,
+        #   cache keys, channel values] of each registered palette
+        self._segments = []
 
-        # Create a clean new palette
-        self._new_palette = displayio.Palette(len(self._src_palette))
+    def __len__(self):
+        """The number of registered palettes."""
+        return len(self._segments)
 
-        # Adjust for normalization, brightness, and gamma
-        norm_palette = []
-        for index, color in enumerate(self._ref_palette):
-            new_r = int(min((color[0] * self._norm_factor) ** self._gamma, 0xFF))
-            new_g = int(min((color[1] * self._norm_factor) ** self._gamma, 0xFF))
-            new_b = int(min((color[2] * self._norm_factor) ** self._gamma, 0xFF))
+    @property
+    def brightness(self):
+        """The overall brightness level of all palettes, 0.0 to 1.0."""
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, new_brightness):
+        if self._brightness != new_brightness:
+            self._brightness = new_brightness
+            self.fade_normalize()
+
+    @property
+    def palettes(self):
+        """A list of the adjusted displayio palettes in registration order."""
+        return [segment[4] for segment in self._segments]
+
+    def add(
+        self, source_palette, gamma=1.0, normalize=False, cache_size=0, target=None
+    ):
+        """Register a source palette with the group. Returns the adjusted
+        displayio palette that is updated in place when the group brightness
+        changes. Transparency is preserved.
 
-            norm_palette.append([new_r, new_g, new_b])
+        :param union(list, displayio.Palette) source_palette: The color source
+          list or displayio palette object. No default.
+        :param float gamma: The gamma value for palette adjustment. Value range
+          is 0.0 to 2.0. Default is 1.0 (no gamma adjustment).
+        :param bool normalize: The boolean normalization state. True to
+          normalize; False to skip normalization. Default is False (no
+          normalization).
+        :param int cache_size: The maximum number of adjusted color lists
+          retained for reuse. Brightness is quantized to 1/CACHE_STEPS
+          increments for this palette when the cache is enabled; the least
+          recently used list is discarded when the cache is full. Default is
+          0 (no cache).
+        :param displayio.Palette target: The palette to update with the
+          adjusted colors; may be the source palette. Default is None (a new
+          palette)."""
+        # pylint: disable=too-many-arguments
+        start = len(self._ref_colors) // 3
+        palette = target
+        if palette is None:
+            palette = displayio.Palette(len(source_palette))
+
+        for index, rgb in enumerate(source_palette):
+            if rgb is None:
+                # Color is None; replace with BLACK and make transparent
+                rgb = 0x000000
+                palette.make_transparent(index)
+            elif not isinstance(source_palette, list):
+                if source_palette.is_transparent(index):
+                    palette.make_transparent(index)
+            self._ref_colors.append((rgb & 0xFF0000) >> 16)
+            self._ref_colors.append((rgb & 0x00FF00) >> 8)
+            self._ref_colors.append(rgb & 0x0000FF)
 
-        # Build new_palette with the newly adjusted color values
-        for index, color in enumerate(norm_palette):
-            self._new_palette[index] = (color[0] << 16) + (color[1] << 8) + color[2]
+        # Find the brightest RGB component for the normalization process
+        ref_palette_max = 0xFF
+        if normalize and len(source_palette):
+            # An all-black palette is not normalized
+            ref_palette_max = max(self._ref_colors[start * 3 :]) or 0xFF
+
+        # A small palette is adjusted directly from its distinct channel values
+        values = None
+        if 3 * len(source_palette) < LUT_SIZE:
+            values = bytes(sorted(set(self._ref_colors[start * 3 :])))
+
+        segment = [
+            start,
+            start + len(source_palette),
+            0xFF / ref_palette_max,
+            gamma,
+            palette,
+            cache_size,
+            {},
+            [],
+            values,
+        ]
+        self._segments.append(segment)
+        self._fade([segment])
+        return palette
 
-            if index in self._list_transparency:
-                # Set new_palette color index transparency status
-                self._new_palette.make_transparent(index)
+    def fade_normalize(self):
+        """Adjust all registered palettes in one pass over the reference color
+        buffer using the current brightness and each palette's gamma and
+        normalize parameters."""
+        self._fade(self._segments)
+
+    def _fade(self, segments):
+        """Adjust registered palettes that are consecutive in the reference
+        color buffer, walking their part of the buffer once and writing each
+        adjusted color to its palette. If a palette's cache is enabled,
+        brightness is quantized and previously adjusted colors are reused when
+        available.
+
+        :param list segments: The registered palettes in buffer order."""
+        # pylint: disable=too-many-locals
+        if not segments:
+            return
+        ref = self._ref_colors
+        rgb = segments[0][0] * 3
+        for segment in segments:
+            start, end, norm_base, gamma, palette = segment[:5]
+            cache_size, cache, cache_keys, values = segment[5:]
+            brightness = self._brightness
+            key = None
+            if cache_size:
+                # Quantize brightness to the cache step size
+                level = round(brightness * CACHE_STEPS)
+                brightness = level / CACHE_STEPS
+                key = (level, gamma)
+                colors = _cache_get(cache, cache_keys, key)
+                if colors is not None:
+                    for index, color in enumerate(colors):
+                        palette[index] = color
+                    rgb += 3 * (end - start)
+                    continue
+
+            table = _channel_table(values, norm_base, brightness, gamma)
+            for index in range(end - start):
+                palette[index] = (
+                    (table[ref[rgb]] << 16)
+                    + (table[ref[rgb + 1]] << 8)
+                    + table[ref[rgb + 2]]
+                )
+                rgb += 3
+
+            if key is not None:
+                colors = [palette[index] for index in range(end - start)]
+                _cache_put(cache, cache_keys, key, colors, cache_size)
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`palettefader_animator`
+================================================================================
+
+PaletteFaderAnimator is a non-blocking helper class for timed brightness and
+gamma transitions of a PaletteFader object or any object with a brightness
+property such as a display graphics group. The transition is divided into a
+fixed number of steps with precomputed per-step deltas; each call to update()
+checks the monotonic clock and applies the current step, if changed. Call
+update() from the primary code loop.
+
+* Author(s): JG for Cedar Grove Maker Studios
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  <https://circuitpython.org/downloads>
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/Palette_Fader.git"
+
+import time
+
+
+class PaletteFaderAnimator:
+    """Timed, non-blocking brightness and gamma transition for a fader
+    object."""
+
+    def __init__(self, fader, steps=32):
+        """Instantiate the animator.
+
+        :param object fader: The PaletteFader or other object with a brightness
+          property to animate. No default.
+        :param int steps: The number of brightness/gamma steps used for each
+          transition. Default is 32 steps."""
+        self._fader = fader
+        self._steps = max(1, steps)
+
+        self._step = self._steps  # Current step; equal to steps when idle
+        self._start_time = 0
+        self._step_duration = 0
+        self._start_brightness = 0
+        self._delta_brightness = 0
+        self._target_brightness = 0
+        self._start_gamma = None
+        self._delta_gamma = 0
+        self._target_gamma = None
+
+    @property
+    def busy(self):
+        """True if a transition is in progress."""
+        return self._step < self._steps
+
+    def start(self, brightness, duration, gamma=None):
+        """Begin a transition from the fader's current values to the target
+        brightness (and gamma, if specified) over the duration in seconds.
+
+        :param float brightness: The target brightness. Value range is 0.0 to
+          1.0. No default.
+        :param float duration: The transition duration in seconds. No default.
+        :param float gamma: The target gamma value. Default is None (no gamma
+          transition)."""
+        self._start_time = time.monotonic()
+        self._step_duration = duration / self._steps
+        self._start_brightness = self._fader.brightness
+        self._delta_brightness = (brightness - self._start_brightness) / self._steps
+        self._target_brightness = brightness
+        self._target_gamma = gamma
+        if gamma is None:
+            self._start_gamma = None
+        else:
+            self._start_gamma = self._fader.gamma
+            self._delta_gamma = (gamma - self._start_gamma) / self._steps
+        self._step = 0
+
+    def stop(self):
+        """End the transition at the current step."""
+        self._step = self._steps
+
+    def update(self):
+        """Apply the transition step for the current time. Returns True if the
+        fader was adjusted. Non-blocking method."""
+        if self._step >= self._steps:
+            return False
+
+        if self._step_duration > 0:
+            step = int((time.monotonic() - self._start_time) / self._step_duration)
+            step = min(step, self._steps)
+        else:
+            step = self._steps
+        if step == self._step:
+            return False
+        self._step = step
+
+        if step == self._steps:
+            # Final step; apply the exact target values
+            if self._target_gamma is not None:
+                self._fader.gamma = self._target_gamma
+            self._fader.brightness = self._target_brightness
+            return True
+
+        if self._start_gamma is not None:
+            self._fader.gamma = self._start_gamma + (self._delta_gamma * step)
+        self._fader.brightness = self._start_brightness + (
+            self._delta_brightness * step
+        )
+        return True
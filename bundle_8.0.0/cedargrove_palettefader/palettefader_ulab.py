@@ -27,6 +27,11 @@ The ulab-based reference palette creation code runs slightly faster than the
 Lightbox project's Reshader class; Copyright 2020 J Epler and L Fried.
 <https://learn.adafruit.com/ocean-epoxy-resin-lightbox-with-rgb-led-matrix-image-scroller>
 
+Unpacking, normalization, gamma, clipping, and packing are whole-array
+operations. Packed 24-bit colors are held in float arrays since ulab has no
+32-bit integer type; single-precision floats represent 24-bit values exactly.
+When ulab is not available (e.g. on a host computer), numpy is used instead.
+
 **Hardware:**
 
 **Software and Dependencies:**
@@ -39,7 +44,10 @@ Lightbox project's Reshader class; Copyright 2020 J Epler and L Fried.
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/CedarGroveStudios/Palette_Fader.git"
 
-from ulab import numpy
+try:
+    from ulab import numpy
+except ImportError:
+    import numpy
 import displayio
 
 
@@ -68,23 +76,23 @@ class PaletteFader:
 
         self._list_transparency = []  # List of transparent items in a color list
 
-        # Create the ulab array reference palette with source palette RGB values
-        self._ref_palette = numpy.zeros((len(self._src_palette), 3), dtype=numpy.uint8)
+        # Unpack the source palette RGB values into the reference palette array
+        colors = numpy.array([0 if rgb is None else rgb for rgb in self._src_palette])
+        red = numpy.floor(colors / 0x10000)
+        red_green = numpy.floor(colors / 0x100)
+        self._ref_palette = numpy.zeros((len(colors), 3))
+        self._ref_palette[:, 0] = red
+        self._ref_palette[:, 1] = red_green - (red * 0x100)
+        self._ref_palette[:, 2] = colors - (red_green * 0x100)
+
         for index, rgb in enumerate(self._src_palette):
-            if rgb is not None:
-                self._ref_palette[index, 2] = rgb & 0x0000FF
-                self._ref_palette[index, 1] = (rgb & 0x00FF00) >> 8
-                self._ref_palette[index, 0] = (rgb & 0xFF0000) >> 16
-
-                if not isinstance(self._src_palette, list):
-                    # Record palette transparency color index
-                    if self._src_palette.is_transparent(index):
-                        self._list_transparency.append(index)
-            else:
-                """Color is None; replace with BLACK in the reference palette
-                and record the color index in the transparency list."""
-                self._ref_palette[index] = [0, 0, 0]
+            if rgb is None:
+                # Color is None; record the color index in the transparency list
                 self._list_transparency.append(index)
+            elif not isinstance(self._src_palette, list):
+                # Record palette transparency color index
+                if self._src_palette.is_transparent(index):
+                    self._list_transparency.append(index)
 
         # Find the brightest RGB component for the normalization process
         if self._normalize:
@@ -136,21 +144,22 @@ class PaletteFader:
         # Create a clean new palette
         self._new_palette = displayio.Palette(len(self._src_palette))
 
-        # Adjust for normalization and brightness
-        norm_palette = numpy.array(
-            self._ref_palette * self._norm_factor, dtype=numpy.uint8
+        # Adjust for normalization, brightness, and gamma; clip to 8 bits
+        norm_palette = numpy.floor(
+            numpy.clip((self._ref_palette * self._norm_factor) ** self._gamma, 0, 0xFF)
+        )
+
+        # Pack the adjusted RGB values into 24-bit color values
+        packed = (
+            (norm_palette[:, 0] * 0x10000)
+            + (norm_palette[:, 1] * 0x100)
+            + norm_palette[:, 2]
         )
-        # Adjust result for gamma
-        norm_palette = numpy.array(norm_palette**self._gamma, dtype=numpy.uint8)
 
         # Build new_palette with the newly adjusted color values
-        for index in range(len(norm_palette)):
-            self._new_palette[index] = (
-                (norm_palette[index, 0] << 16)
-                + (norm_palette[index, 1] << 8)
-                + norm_palette[index, 2]
-            )
-
-            if index in self._list_transparency:
-                # Set new_palette color index transparency status
-                self._new_palette.make_transparent(index)
+        for index, color in enumerate(packed):
+            self._new_palette[index] = int(color)
+
+        for index in self._list_transparency:
+            # Set new_palette color index transparency status
+            self._new_palette.make_transparent(index)
@@ -22,7 +22,9 @@ __repo__ = "https://github.com/CedarGroveStudios/MatrixWeather"
 # import snowman_code
 
 """Set FAILOVER to True to fail to a dimmed display and flashing NeoPixel;
-False to fail normally with error reporting via the REPL."""
+False to fail normally with error reporting via the REPL. Network, rendering,
+and memory failures are recovered in place by the matrixweather_code task
+supervisor; only unrecoverable failures reach the failover and reset."""
 FAILOVER = True
 
 while True and FAILOVER:
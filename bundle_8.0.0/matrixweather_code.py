@@ -10,15 +10,29 @@ Matrix Weather for Matrix Portal
 This project queries the Open Weather Maps site API to report a location's
 current weather conditions using the MatrixPortal's 32x64 LED display.
 """
-import time
+import asyncio
 import board
+import busio
+import microcontroller
 import supervisor
 from analogio import AnalogIn
 from digitalio import DigitalInOut, Direction, Pull
+from adafruit_esp32spi import adafruit_esp32spi
 from adafruit_matrixportal.network import Network
 from adafruit_matrixportal.matrix import Matrix
 from simpleio import map_range
+from cedargrove_palettefader.palettefader_animator import PaletteFaderAnimator
 import matrixweather_graphics  # pylint: disable=wrong-import-position
+import matrixweather_data
+from matrixweather_scheduler import Scheduler
+from matrixweather_fetch import (
+    CONNECTION_ERRORS,
+    TRANSIENT_ERRORS,
+    RetryPolicy,
+    WeatherConnection,
+    WeatherFetcher,
+)
+import matrixweather_supervisor
 
 print("running matrixweather_code.py")
 
@@ -43,9 +57,12 @@ UNITS = "imperial"  # can pick 'imperial' or 'metric' as part of URL query
 LOCATION = secrets["location"]
 # display settings
 DISPLAY_BRIGHTNESS = 0.1  # 0.1 minimum; 1.0 maximum
+NIGHT_BRIGHTNESS = 0.06  # brightness after sunset; 0.06 minimum
+FADE_DURATION = 60  # seconds for the sunrise/sunset brightness transition
 DISPLAY_GAMMA = 1.0  # No adjustment = 1.0; can range from 0.0 to 2.0
-SCROLL_DELAY = 0.1
+SCROLL_SPEED = 10  # description scroll speed in pixels per second
 SCROLL_HOLD_TIME = 0  # set this to hold each line before finishing scroll
+BUTTON_DELAY = 0.1  # seconds between brightness button checks
 
 # Set up from where we'll be fetching data
 DATA_SOURCE = (
@@ -55,7 +72,11 @@ DATA_SOURCE = (
 # it goes in your secrets.py file on a line such as:
 # 'openweather_token' : 'your_big_humongous_gigantor_token',
 DATA_SOURCE += "&appid=" + secrets["openweather_token"]
-DATA_LOCATION = []
+FETCH_CHUNK_SIZE = 64  # Bytes read from the socket at a time
+RETRY_DELAY = 10  # seconds before the first retry of a failed weather query
+RETRY_ATTEMPTS = 5  # failed queries in a row before pausing the queries
+RETRY_PAUSE = 1800  # seconds to pause the queries after RETRY_ATTEMPTS failures
+RECONNECT_FAILURES = 2  # failed queries in a row before resetting the WiFi
 
 # instantiate buttons
 button_down = DigitalInOut(board.BUTTON_DOWN)
@@ -67,8 +88,9 @@ button_up.switch_to_input(pull=Pull.UP)
 # instantiate potentiometer
 potentiometer = AnalogIn(board.A0)
 
-# instantiate network connection
-network = Network(status_neopixel=board.NEOPIXEL, debug=True)
+# The last good weather is kept in non-volatile memory and shown at startup,
+#   before the ESP32 is set up
+weather_snapshot = matrixweather_data.WeatherSnapshot(microcontroller.nvm)
 
 # build display graphics and enable the display
 gfx = matrixweather_graphics.MatrixWeatherGraphics(
@@ -77,50 +99,169 @@ gfx = matrixweather_graphics.MatrixWeatherGraphics(
     units=UNITS,
     brightness=DISPLAY_BRIGHTNESS,
     gamma=DISPLAY_GAMMA,
+    scroll_speed=SCROLL_SPEED,
+    scroll_hold=SCROLL_HOLD_TIME,
+    snapshot=weather_snapshot,
 )
 matrix.display.brightness = 1
 print(f"gfx display loaded:   gfx.brightness = {gfx.brightness}")
 
-localtime_refresh = None
-weather_refresh = None
-scroll_refresh = None
+# instantiate network connection; the ESP32 is kept so that it can be reset
+esp32_cs = DigitalInOut(board.ESP_CS)
+esp32_ready = DigitalInOut(board.ESP_BUSY)
+esp32_reset = DigitalInOut(board.ESP_RESET)
+spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
+esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
+network = Network(
+    status_neopixel=board.NEOPIXEL, esp=esp, external_spi=spi, debug=True
+)
 
-while True:
-    # only query the online time once per hour (and on first run)
-    if (not localtime_refresh) or (time.monotonic() - localtime_refresh) > 3600:
-        try:
-            #print("Getting time from internet!")
-            localtime_refresh = time.monotonic()
-        except RuntimeError as e:
-            print("Some error occured, retrying! -", e)
-            continue
+# Keeps the connection to the weather host alive between queries; a lost
+#   WiFi connection gets one attempt per query
+connection = WeatherConnection(network)
+
+# Fetches the displayed weather fields; caches the last good weather
+weather_fetcher = WeatherFetcher(
+    connection,
+    DATA_SOURCE,
+    matrixweather_data.FieldExtractor(),
+    chunk_size=FETCH_CHUNK_SIZE,
+    retry_policy=RetryPolicy(
+        base_delay=RETRY_DELAY, max_attempts=RETRY_ATTEMPTS, open_time=RETRY_PAUSE
+    ),
+)
+
+# Smoothly transition display brightness at sunrise and sunset
+brightness_fader = PaletteFaderAnimator(gfx)
+daylight = True
 
-    # only query the weather every 10 minutes (and on first run)
-    if (not weather_refresh) or (time.monotonic() - weather_refresh) > 600:
+
+def sync_time():
+    """Query the online time."""
+    #print("Getting time from internet!")
+    #network.get_local_time()
+
+
+def reconnect(category, error):
+    """Reset the ESP32 and reconnect to WiFi after a connection failure. If
+    the connection attempt fails, the next weather query tries again."""
+    if category != matrixweather_supervisor.NETWORK:
+        return
+    if not isinstance(error, CONNECTION_ERRORS):
+        return
+    print("Resetting the ESP32 and reconnecting")
+    connection.reset()
+    esp.reset()
+    try:
+        # One attempt; the retry policy spaces out the next
+        network.connect(max_attempts=1)
+    except CONNECTION_ERRORS as e:
+        print("Reconnect failed -", e)
+
+
+async def update_weather():
+    """Query the weather every 10 minutes. Retry after an error as allowed by
+    the retry policy; the cached weather stays on the display in the
+    meantime. Repeated connection failures are raised to the supervisor to
+    reconnect; HTTP and response errors are only retried."""
+    global daylight  # pylint: disable=global-statement
+    retry_policy = weather_fetcher.retry_policy
+    while True:
+        await asyncio.sleep(retry_policy.delay)
+        print(f"Getting weather for {LOCATION}")
         try:
-            print(f"Getting weather for {LOCATION}")
-            value = network.fetch_data(DATA_SOURCE, json_path=(DATA_LOCATION,))
-            # print("Response is: ", value)
-            gfx.display_weather(value)
-            weather_refresh = time.monotonic()
-        except RuntimeError as e:
-            print("Some error occured, retrying! -", e)
+            weather = await weather_fetcher.fetch()
+        except TRANSIENT_ERRORS as e:
+            # No cached weather yet
+            print("Weather fetch failed -", e)
+        error = weather_fetcher.error
+        if error is not None:
+            if (
+                isinstance(error, CONNECTION_ERRORS)
+                and retry_policy.failures >= RECONNECT_FAILURES
+            ):
+                raise error
             continue
+        print(
+            f"fetch timing: connect {connection.connect_time:.3f} s, "
+            + f"request {connection.request_time:.3f} s, "
+            + f"read {weather_fetcher.read_time:.3f} s, "
+            + f"sessions {connection.session_count}"
+        )
+
+        if weather_fetcher.changed:
+            print(matrixweather_data.weather_summary(weather, UNITS == "metric"))
+            if gfx.display_weather(weather):
+                gfx.refresh()
+            weather_snapshot.save(weather)
+
+            # The icon name ends with "n" after sunset
+            icon = weather[matrixweather_data.ICON]
+            new_daylight = daylight if not icon else icon[-1:] != "n"
+            if new_daylight != daylight:
+                daylight = new_daylight
+                if daylight:
+                    brightness_fader.start(DISPLAY_BRIGHTNESS, FADE_DURATION)
+                else:
+                    brightness_fader.start(NIGHT_BRIGHTNESS, FADE_DURATION)
+        await asyncio.sleep(600)
+
+
+def check_buttons():
+    """Check the up-down buttons and advance a sunrise/sunset brightness
+    transition."""
+    brightness_fader.update()
+
+    if not button_up.value:
+        brightness_fader.stop()
+        gfx.brightness = min(gfx.brightness + 0.01, 1.0)
+        print(f"display brightness: {gfx.brightness:0.2f}")
+    if not button_down.value:
+        brightness_fader.stop()
+        gfx.brightness = max(gfx.brightness - 0.01, 0.06)
+        print(f"display brightness: {gfx.brightness:0.2f}")
+
+    # uncomment the following block if a potentiometer is used
+    """gfx.brightness = map_range(potentiometer.value, 0, 54000, 0.04, 1.0)
+    #print(potentiometer.value)
+    print(f"display brightness: {gfx.brightness:0.2f}")"""
+
+
+def print_schedule_report():
+    """Print the periodic job timing statistics."""
+    print(scheduler.report())
+
+
+# Scroll at twice the pixel rate so that no step is late by more than half a
+# step; the scroll position is calculated from the elapsed time
+scheduler = Scheduler()
+scheduler.every(0.5 / SCROLL_SPEED, gfx.scroll_description, name="scroll")
+scheduler.every(BUTTON_DELAY, check_buttons, fixed_rate=False)
+scheduler.every(3600, sync_time, fixed_rate=False)
+scheduler.every(3600, print_schedule_report, fixed_rate=False, delay=3600)
+
+
+# Restarts failed tasks in place; unrecoverable failures are raised to code.py
+task_supervisor = matrixweather_supervisor.Supervisor()
+
+
+async def main():
+    """Run the periodic jobs and the weather task under the supervisor."""
+    await asyncio.gather(
+        asyncio.create_task(
+            task_supervisor.run(
+                "display", matrixweather_supervisor.RENDERING, scheduler.run
+            )
+        ),
+        asyncio.create_task(
+            task_supervisor.run(
+                "weather",
+                matrixweather_supervisor.NETWORK,
+                update_weather,
+                recover=reconnect,
+            )
+        ),
+    )
+
 
-    # only scroll the description every SCROLL_DELAY seconds (and on first run)
-    # also adjust brightness with up-down buttons during scrolling interval
-    if (not scroll_refresh) or (time.monotonic() - scroll_refresh) > SCROLL_DELAY:
-        gfx.scroll_description()
-        scroll_refresh = time.monotonic()
-
-        if not button_up.value:
-            gfx.brightness = min(gfx.brightness + 0.01, 1.0)
-            print(f"display brightness: {gfx.brightness:0.2f}")
-        if not button_down.value:
-            gfx.brightness = max(gfx.brightness - 0.01, 0.06)
-            print(f"display brightness: {gfx.brightness:0.2f}")
-
-        # uncomment the following block if a potentiometer is used
-        """gfx.brightness = map_range(potentiometer.value, 0, 54000, 0.04, 1.0)
-        #print(potentiometer.value)
-        print(f"display brightness: {gfx.brightness:0.2f}")"""
+asyncio.run(main())
@@ -0,0 +1,414 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+#
+# matrixweather_data.py
+
+"""
+Weather data extraction for Matrix Weather. A FieldExtractor is compiled from a
+list of key paths into a tree so that shared path prefixes (e.g. the
+response's "weather" list entry) are looked up once. extract() walks the
+OpenWeatherMap response a single time and returns a fixed-slot record list;
+a value that is not present in the response is set to MISSING.
+
+extract_chunks() does the same for a response body that is still arriving
+from the socket. It parses the JSON text incrementally and only keeps the
+requested values, so the full document is never held in memory. Peak memory
+is the chunk size plus the fixed-size value buffer. A string value longer
+than the buffer is truncated; any other value that is too long is MISSING.
+
+WeatherSnapshot stores a weather record in a few dozen bytes of non-volatile
+memory so that the last good weather can be shown immediately after a reset,
+before the network is up.
+"""
+
+import json
+import struct
+import time
+
+MISSING = None  # Record value for a field not present in the response
+
+# Record slots for WEATHER_FIELDS
+TEMPERATURE = 0
+HUMIDITY = 1
+WIND_SPEED = 2
+WIND_DIRECTION = 3
+ICON = 4
+DESCRIPTION = 5
+TIMESTAMP = 6
+
+# Key path of each record slot in the OpenWeatherMap current weather response
+WEATHER_FIELDS = (
+    ("main", "temp"),
+    ("main", "humidity"),
+    ("wind", "speed"),
+    ("wind", "deg"),
+    ("weather", 0, "icon"),
+    ("weather", 0, "description"),
+    ("dt",),
+)
+
+# WeatherSnapshot layout: magic, missing-slot bit mask, temperature, humidity,
+#   wind speed, wind direction, observation time, icon, description length,
+#   and description; followed by a checksum byte
+SNAPSHOT_MAGIC = b"MW\x01"
+SNAPSHOT_FORMAT = "<3sBfHfHI3sB48s"
+SNAPSHOT_SIZE = struct.calcsize(SNAPSHOT_FORMAT) + 1
+
+# Parser states for FieldExtractor.extract_chunks()
+_VALUE = 0  # Expecting a value
+_KEY = 1  # Expecting an object key
+_COLON = 2  # Expecting the colon after an object key
+_NEXT = 3  # Expecting a comma or the end of the container
+_STRING = 4  # In a string
+_LITERAL = 5  # In a number, true, false, or null
+_DONE = 6  # At the end of the document
+
+# A list of named compass directions for use with wind speed
+COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
+class FieldExtractor:
+    """Extracts a fixed list of key paths from a JSON document in one pass."""
+
+    def __init__(self, fields=WEATHER_FIELDS, buffer_size=64):
+        """Compile the key paths into a lookup tree.
+
+        :param tuple fields: The key path of each record slot. Keys are dict
+          keys or list indices. Each path must lead to a string, number,
+          boolean, or null value. Default is WEATHER_FIELDS.
+        :param int buffer_size: The longest object key or extracted value, in
+          bytes, that extract_chunks() can hold. Longer string values are
+          truncated and other values are MISSING. Default is 64 bytes."""
+        self._buffer = bytearray(buffer_size)
+        self._slot_count = len(fields)
+        self._tree = {}  # key: [record slot or None, subtree]
+        for slot, path in enumerate(fields):
+            node = self._tree
+            for depth, key in enumerate(path):
+                if key not in node:
+                    node[key] = [None, {}]
+                if depth == len(path) - 1:
+                    node[key][0] = slot
+                node = node[key][1]
+
+    def extract(self, document):
+        """Return a record list with a value for each key path; MISSING if the
+        path is not present.
+
+        :param dict document: The parsed JSON document."""
+        record = [MISSING] * self._slot_count
+        self._walk(self._tree, document, record)
+        return record
+
+    def extract_chunks(self, chunks):
+        """Return a record list with a value for each key path; MISSING if the
+        path is not present. Parses JSON text as it arrives and stops reading
+        at the end of the document. Values that are not requested are skipped
+        without being stored. Raises ValueError if the chunks end before the
+        document does.
+
+        :param chunks: An iterable of bytes objects containing the JSON text,
+          such as Response.iter_content()."""
+        parser = self.chunk_parser()
+        for chunk in chunks:
+            record = parser.send(chunk)
+            if record is not None:
+                return record
+        raise ValueError("JSON document is incomplete")
+
+    def chunk_parser(self):
+        """Return a generator that parses JSON text sent to it one chunk at a
+        time, so that the caller can do other work between chunks. send()
+        returns None until the end of the document and then returns the
+        record list."""
+        parser = self._parse()
+        next(parser)
+        return parser
+
+    def _parse(self):
+        # pylint: disable=too-many-branches,too-many-statements
+        record = [MISSING] * self._slot_count
+        buffer = self._buffer
+        size = len(buffer)
+        length = 0  # Bytes in the current key or value; may exceed size
+        frames = []  # [subtree, is list, list index] of each open container
+        target = (None, self._tree)  # Slot and subtree of the next value
+        state = _VALUE
+        skip_depth = 0  # Nesting depth of a container that is being skipped
+        capture = False  # Keep the current string or literal in the buffer
+        is_key = False
+        escape = False
+
+        while state != _DONE:
+            chunk = yield None
+            for byte in chunk:
+                if state == _STRING:
+                    if escape:
+                        escape = False
+                    elif byte == 0x5C:  # Backslash
+                        escape = True
+                    elif byte == 0x22:  # Closing quote
+                        if is_key:
+                            key = None
+                            if length <= size:
+                                key = str(buffer[:length], "utf-8")
+                            target = frames[-1][0].get(key)
+                            state = _COLON
+                            continue
+                        state = _NEXT
+                        if not capture:
+                            continue
+                    if capture:
+                        if length < size:
+                            buffer[length] = byte
+                        length += 1
+                        if state == _NEXT:
+                            record[target[0]] = self._decode(length)
+                    continue
+
+                if state == _LITERAL:
+                    if byte > 0x20 and byte not in (0x2C, 0x5D, 0x7D):
+                        if capture:
+                            if length < size:
+                                buffer[length] = byte
+                            length += 1
+                        continue
+                    if capture:
+                        record[target[0]] = self._decode(length)
+                    state = _NEXT
+
+                if skip_depth:
+                    if byte == 0x22:
+                        state = _STRING
+                        capture = is_key = False
+                    elif byte in (0x5B, 0x7B):  # [ or {
+                        skip_depth += 1
+                    elif byte in (0x5D, 0x7D):  # ] or }
+                        skip_depth -= 1
+                        if not skip_depth:
+                            state = _NEXT
+                    continue
+
+                if byte <= 0x20:  # Whitespace
+                    continue
+
+                if byte in (0x5D, 0x7D):  # End of a (possibly empty) container
+                    frames.pop()
+                    if not frames:
+                        state = _DONE
+                        break
+                    state = _NEXT
+                elif state == _VALUE:
+                    slot, subtree = target if target else (None, None)
+                    if byte in (0x5B, 0x7B):  # Start of a list or object
+                        if subtree:
+                            is_list = byte == 0x5B
+                            frames.append([subtree, is_list, 0])
+                            if is_list:
+                                target = subtree.get(0)
+                            else:
+                                state = _KEY
+                        else:
+                            skip_depth = 1
+                    else:
+                        state = _STRING if byte == 0x22 else _LITERAL
+                        capture = slot is not None
+                        is_key = False
+                        buffer[0] = byte
+                        length = 1
+                elif state == _KEY:
+                    if byte == 0x22:
+                        state = _STRING
+                        capture = is_key = True
+                        length = 0
+                elif state == _COLON:
+                    state = _VALUE
+                elif byte == 0x2C:  # Comma after a value
+                    frame = frames[-1]
+                    if frame[1]:
+                        frame[2] += 1
+                        target = frame[0].get(frame[2])
+                        state = _VALUE
+                    else:
+                        state = _KEY
+        while True:
+            yield record
+
+    def _decode(self, length):
+        buffer = self._buffer
+        if length > len(buffer):
+            if buffer[0] != 0x22:  # Not a string
+                return MISSING
+            # Close the string after its last complete character
+            return json.loads(str(buffer[: _string_end(buffer)], "utf-8") + '"')
+        return json.loads(str(buffer[:length], "utf-8"))
+
+    def _walk(self, node, value, record):
+        for key, (slot, subtree) in node.items():
+            try:
+                child = value[key]
+            except (KeyError, IndexError, TypeError):
+                continue
+            if slot is not None:
+                record[slot] = child
+            if subtree:
+                self._walk(subtree, child, record)
+
+
+class WeatherSnapshot:
+    """Saves and loads a WEATHER_FIELDS record in a byte buffer such as
+    microcontroller.nvm. The description is truncated to 48 bytes."""
+
+    def __init__(self, storage, offset=0, min_interval=3600):
+        """Instantiate the snapshot.
+
+        :param storage: The writable byte buffer. No default.
+        :param int offset: The snapshot's position in storage. Default is 0.
+        :param float min_interval: The shortest time between writes in
+          seconds, to limit flash wear. Default is 3600 seconds."""
+        self._storage = storage
+        self._offset = offset
+        self._min_interval = min_interval
+        self._save_time = None  # Monotonic time of the last write
+
+    def save(self, record):
+        """Write the record if min_interval has passed since the last write and
+        the stored snapshot differs. Returns True if written.
+
+        :param list record: The weather record from FieldExtractor."""
+        now = time.monotonic()
+        if self._save_time is not None:
+            if now - self._save_time < self._min_interval:
+                return False
+
+        missing = 0
+        values = []
+        for slot, value in enumerate(record):
+            if value is MISSING:
+                missing |= 1 << slot
+            values.append(value)
+        description = _truncate_utf8((values[DESCRIPTION] or "").encode("utf-8"), 48)
+
+        data = bytearray(
+            struct.pack(
+                SNAPSHOT_FORMAT,
+                SNAPSHOT_MAGIC,
+                missing,
+                values[TEMPERATURE] or 0,
+                int(values[HUMIDITY] or 0),
+                values[WIND_SPEED] or 0,
+                int(values[WIND_DIRECTION] or 0),
+                values[TIMESTAMP] or 0,
+                (values[ICON] or "").encode("utf-8"),
+                len(description),
+                description,
+            )
+        )
+        data.append(sum(data) & 0xFF)
+
+        start = self._offset
+        self._save_time = now
+        if self._storage[start : start + SNAPSHOT_SIZE] == data:
+            return False
+        self._storage[start : start + SNAPSHOT_SIZE] = data
+        return True
+
+    def load(self):
+        """Return the saved record; None if there is no valid snapshot."""
+        data = self._storage[self._offset : self._offset + SNAPSHOT_SIZE]
+        if data[:3] != SNAPSHOT_MAGIC or sum(data[:-1]) & 0xFF != data[-1]:
+            return None
+        (
+            _,
+            missing,
+            temperature,
+            humidity,
+            wind_speed,
+            wind_direction,
+            timestamp,
+            icon,
+            length,
+            description,
+        ) = struct.unpack_from(SNAPSHOT_FORMAT, data)
+        record = [
+            round(temperature, 2),
+            humidity,
+            round(wind_speed, 2),
+            wind_direction,
+            str(icon, "utf-8"),
+            str(description[:length], "utf-8"),
+            timestamp,
+        ]
+        for slot in range(len(record)):
+            if missing & (1 << slot):
+                record[slot] = MISSING
+        return record
+
+
+def _string_end(text):
+    """The length of the longest part of a truncated JSON string, including
+    its opening quote, that does not end within a UTF-8 character or an
+    escape sequence."""
+    size = len(text)
+    end = index = 1
+    while index < size:
+        byte = text[index]
+        if byte == 0x5C:  # Backslash
+            step = 2
+            if index + 1 < size and text[index + 1] == 0x75:  # \uXXXX
+                step = 6
+                if index + 3 < size and text[index + 2] in b"dD":
+                    if text[index + 3] in b"89abAB":
+                        step = 12  # A surrogate pair
+        elif byte >= 0xF0:
+            step = 4
+        elif byte >= 0xE0:
+            step = 3
+        elif byte >= 0xC0:
+            step = 2
+        else:
+            step = 1
+        index += step
+        if index <= size:
+            end = index
+    return end
+
+
+def _truncate_utf8(text, size):
+    """Truncate UTF-8 encoded bytes to size bytes or fewer without splitting
+    a character."""
+    if len(text) <= size:
+        return text
+    end = size
+    while end and text[end] & 0xC0 == 0x80:  # A continuation byte
+        end -= 1
+    return text[:end]
+
+
+def compass_direction(degrees):
+    """The named compass direction for a wind direction in degrees."""
+    return COMPASS[int(((degrees + 22.5) % 360) / 45)]
+
+
+def weather_summary(record, metric=False):
+    """A printable multi-line summary of a weather record.
+
+    :param list record: The weather record from FieldExtractor.extract().
+    :param bool metric: True for metric units; False for imperial."""
+    lines = []
+    if record[TEMPERATURE] is not MISSING:
+        lines.append(f"Temperature: {record[TEMPERATURE]:.0f}°")
+    if record[DESCRIPTION] is not MISSING:
+        lines.append(f"Description: {record[DESCRIPTION]}")
+    if record[HUMIDITY] is not MISSING:
+        lines.append(f"Humidity: {record[HUMIDITY]:.0f}% RH")
+    if MISSING in (record[WIND_SPEED], record[WIND_DIRECTION]):
+        lines.append("No wind")
+    else:
+        speed_units = "m/s" if metric else "MPH"
+        lines.append(
+            f"Wind: {record[WIND_SPEED]} {speed_units}, {record[WIND_DIRECTION]}° "
+            + f"({compass_direction(record[WIND_DIRECTION])})"
+        )
+    return "\n".join(lines)
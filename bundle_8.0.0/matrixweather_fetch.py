@@ -0,0 +1,362 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+#
+# matrixweather_fetch.py
+
+"""
+Cached weather fetches for Matrix Weather. WeatherFetcher keeps the last good
+weather record with the response's ETag and Last-Modified validators and
+sends them with the next request. A 304 Not Modified response is answered
+from the cache without reading a body, and a new response with the same
+observation time (the "dt" field) is reported as unchanged so the display is
+not redrawn. If a fetch fails with a transient error -- a network error, an
+HTTP error status, or an incomplete response -- the cached record is served
+and marked stale.
+
+A RetryPolicy spaces out the attempts after a failure. The delay doubles
+after each consecutive failure, up to a limit, with random jitter so that the
+retries of several displays don't line up. After max_attempts consecutive
+failures the circuit opens: no requests are sent for open_time seconds. Then
+a single trial request is allowed (half-open); success closes the circuit and
+failure opens it again.
+
+WeatherConnection is an optional keep-alive connection for WeatherFetcher. It
+sends requests through its own adafruit_requests session over the ESP32SPI
+sockets, skipping the Network.fetch() connection check and garbage
+collection, so the socket to the weather host is reused between fetches. A
+lost WiFi connection is retried once per fetch rather than blocking through
+repeated attempts; the RetryPolicy spaces out the next fetch. If a request
+fails or a response is left unfinished, the session is dropped and a new one
+is opened on the next fetch. The connect and request times of each
+fetch are kept for tuning.
+"""
+
+import asyncio
+import random
+import time
+import adafruit_requests
+from adafruit_esp32spi import adafruit_esp32spi_socket
+import matrixweather_data
+
+# Errors from a fetch that are expected to clear on a later attempt
+TRANSIENT_ERRORS = (RuntimeError, OSError, ValueError, adafruit_requests.OutOfRetries)
+
+# Transient errors raised by the WiFi connection or socket rather than by an
+#   HTTP error status or an incomplete response
+CONNECTION_ERRORS = (OSError, ConnectionError, adafruit_requests.OutOfRetries)
+
+# RetryPolicy circuit states
+CLOSED = "closed"  # Requests are sent
+OPEN = "open"  # Requests are paused after repeated failures
+HALF_OPEN = "half-open"  # One trial request is allowed
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter and a circuit breaker for retries."""
+
+    def __init__(
+        self, base_delay=10, max_delay=300, max_attempts=5, open_time=1800, jitter=0.5
+    ):
+        """Instantiate the policy.
+
+        :param float base_delay: The delay after the first failure in seconds.
+          Default is 10 seconds.
+        :param float max_delay: The longest delay between attempts in seconds.
+          Default is 300 seconds.
+        :param int max_attempts: Consecutive failures that open the circuit.
+          Default is 5.
+        :param float open_time: The time that the circuit stays open in
+          seconds. Default is 1800 seconds.
+        :param float jitter: The fraction of each delay that is randomized;
+          0.0 to 1.0. Default is 0.5."""
+        # pylint: disable=too-many-arguments
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._max_attempts = max_attempts
+        self._open_time = open_time
+        self._jitter = jitter
+
+        self._state = CLOSED
+        self._failures = 0  # Consecutive failures
+        self._retry_time = 0  # Monotonic time of the next allowed attempt
+
+    @property
+    def state(self):
+        """The circuit state: CLOSED, OPEN, or HALF_OPEN."""
+        return self._state
+
+    @property
+    def failures(self):
+        """The number of consecutive failures."""
+        return self._failures
+
+    @property
+    def delay(self):
+        """Seconds until the next attempt is allowed; 0 if allowed now."""
+        return max(0, self._retry_time - time.monotonic())
+
+    def allow(self):
+        """Return True if an attempt may be made now. An open circuit becomes
+        half-open when its open time has passed."""
+        if time.monotonic() < self._retry_time:
+            return False
+        if self._state == OPEN:
+            self._state = HALF_OPEN
+        return True
+
+    def success(self):
+        """Record a successful attempt; closes the circuit."""
+        self._state = CLOSED
+        self._failures = 0
+        self._retry_time = 0
+
+    def failure(self):
+        """Record a failed attempt and schedule the next one. Returns the delay
+        in seconds."""
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self._max_attempts:
+            self._state = OPEN
+            delay = self._open_time
+        else:
+            delay = min(self._max_delay, self._base_delay * 2 ** (self._failures - 1))
+            delay *= 1 - self._jitter * random.random()
+        self._retry_time = time.monotonic() + delay
+        return delay
+
+
+class WeatherFetcher:
+    """Fetches weather records with a conditional request cache."""
+
+    def __init__(self, network, url, fields, chunk_size=64, retry_policy=None):
+        """Instantiate the fetcher.
+
+        :param object network: The Network object. No default.
+        :param str url: The weather query URL. No default.
+        :param FieldExtractor fields: Extracts the weather record from the
+          response. Must include matrixweather_data.TIMESTAMP. No default.
+        :param int chunk_size: Bytes read from the socket at a time. Default
+          is 64 bytes.
+        :param RetryPolicy retry_policy: Spaces out the attempts after a
+          failure. Default is a RetryPolicy with default settings."""
+        # pylint: disable=too-many-arguments
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self._retry_policy = retry_policy
+        self._network = network
+        self._url = url
+        self._fields = fields
+        self._chunk_size = chunk_size
+
+        self._record = None
+        self._etag = None
+        self._last_modified = None
+        self._changed = False
+        self._stale = False
+        self._error = None
+        self._fetch_time = None  # Monotonic time of the last good fetch
+        self._read_time = 0
+
+    @property
+    def record(self):
+        """The last good weather record; None before the first good fetch."""
+        return self._record
+
+    @property
+    def changed(self):
+        """True if the last fetch returned a new observation."""
+        return self._changed
+
+    @property
+    def stale(self):
+        """True if the last fetch failed and the cached record was served."""
+        return self._stale
+
+    @property
+    def error(self):
+        """The transient error of the last fetch; None if it succeeded or
+        the cached record was current."""
+        return self._error
+
+    @property
+    def retry_policy(self):
+        """The RetryPolicy."""
+        return self._retry_policy
+
+    @property
+    def read_time(self):
+        """Seconds spent reading and parsing the last response body, not
+        counting the time given to other tasks."""
+        return self._read_time
+
+    @property
+    def age(self):
+        """Seconds since the last good fetch; None before the first."""
+        if self._fetch_time is None:
+            return None
+        return time.monotonic() - self._fetch_time
+
+    async def fetch(self):
+        """Fetch and return the weather record. Serves the cached record if
+        the server reports it unchanged, if the retry policy doesn't allow an
+        attempt yet, or if the fetch fails with a transient error; raises the
+        error if nothing is cached. Check retry_policy.delay for the time until
+        the next attempt is allowed."""
+        self._changed = False
+        policy = self._retry_policy
+        try:
+            if not policy.allow():
+                raise RuntimeError(f"weather requests paused; circuit {policy.state}")
+            try:
+                record = await self._request()
+            except Exception:
+                policy.failure()
+                raise
+        except TRANSIENT_ERRORS as e:
+            self._error = e
+            if self._record is None:
+                raise
+            print("Weather fetch failed, serving cached weather -", e)
+            self._stale = True
+            return self._record
+
+        policy.success()
+        self._stale = False
+        self._error = None
+        self._fetch_time = time.monotonic()
+        if record is None:
+            print("Weather not modified")
+            return self._record
+
+        timestamp = matrixweather_data.TIMESTAMP
+        if (
+            self._record is None
+            or record[timestamp] is matrixweather_data.MISSING
+            or record[timestamp] != self._record[timestamp]
+        ):
+            self._changed = True
+            self._record = record
+        return self._record
+
+    async def _request(self):
+        """Send the conditional request. Returns the new record, or None if
+        the cached record is still current."""
+        headers = {}
+        if self._record is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        response = self._network.fetch(self._url, headers=headers)
+        try:
+            status = response.status_code
+            if status == 304:
+                return None
+            if status != 200:
+                raise RuntimeError(f"HTTP status {status}")
+            self._network.check_response(response)
+
+            parser = self._fields.chunk_parser()
+            self._read_time = 0
+            start = time.monotonic()
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                record = parser.send(chunk)
+                if record is not None:
+                    break
+                self._read_time += time.monotonic() - start
+                await asyncio.sleep(0)
+                start = time.monotonic()
+            else:
+                raise ValueError("weather response is incomplete")
+            self._read_time += time.monotonic() - start
+
+            etag = last_modified = None
+            for name, value in response.headers.items():
+                name = name.lower()
+                if name == "etag":
+                    etag = value
+                elif name == "last-modified":
+                    last_modified = value
+            self._etag = etag
+            self._last_modified = last_modified
+            return record
+        finally:
+            response.close()
+
+
+class WeatherConnection:
+    """A keep-alive HTTP connection for weather fetches. Use in place of the
+    Network object when instantiating WeatherFetcher. Supports http URLs."""
+
+    def __init__(self, network):
+        """Instantiate the connection.
+
+        :param object network: The Network object used to connect to WiFi
+          and check responses. No default."""
+        self._network = network
+        self._session = None
+        self._response = None  # The last response returned by fetch()
+        self._session_count = 0
+        self._connect_time = 0
+        self._request_time = 0
+
+    @property
+    def session_count(self):
+        """The number of sessions opened; one plus the number of
+        reconnections."""
+        return self._session_count
+
+    @property
+    def connect_time(self):
+        """Seconds spent checking the WiFi connection and opening a session
+        for the last fetch."""
+        return self._connect_time
+
+    @property
+    def request_time(self):
+        """Seconds from sending the last request to receiving its response
+        headers; includes opening the socket if it was not reused."""
+        return self._request_time
+
+    def fetch(self, url, *, headers=None, timeout=10):
+        """Send a GET request and return the response. Close the response
+        after reading it so that the socket can be reused.
+
+        :param str url: The URL to fetch. No default.
+        :param dict headers: Extra request headers. Default is None.
+        :param int timeout: The timeout period in seconds. Default is 10."""
+        start = time.monotonic()
+        if self._response is not None and self._response.socket is not None:
+            # The last response was not closed; its socket can't be reused
+            self.reset()
+        if not self._network.is_connected:
+            self._network.connect(max_attempts=1)
+        if self._session is None:
+            self._session = adafruit_requests.Session(adafruit_esp32spi_socket)
+            self._session_count += 1
+        request_start = time.monotonic()
+        self._connect_time = request_start - start
+
+        try:
+            self._response = self._session.get(url, headers=headers, timeout=timeout)
+        except (RuntimeError, OSError, adafruit_requests.OutOfRetries):
+            self.reset()
+            raise
+        self._request_time = time.monotonic() - request_start
+        return self._response
+
+    def check_response(self, response):
+        """Raise an HttpError unless the response status is OK."""
+        return self._network.check_response(response)
+
+    def reset(self):
+        """Close the socket of an unfinished response and drop the session. A
+        new session is opened by the next fetch()."""
+        if self._response is not None and self._response.socket is not None:
+            try:
+                self._response.socket.close()
+            except OSError:
+                pass
+        self._response = None
+        self._session = None
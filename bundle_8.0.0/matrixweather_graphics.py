@@ -6,11 +6,14 @@
 # matrixweather_graphics.py
 
 
+import time
 import displayio
 import terminalio
 from adafruit_display_text.label import Label
 import adafruit_imageload
-from cedargrove_palettefader.palettefader import PaletteFader
+from cedargrove_palettefader.palettefader import PaletteFaderGroup
+from cedargrove_palettefader.groupfader import GroupFader
+import matrixweather_data as data
 
 # Color list for labels
 LABEL_COLORS_REF = [
@@ -26,12 +29,24 @@ DISPLAY_FONT = terminalio.FONT
 ICON_SPRITESHEET = cwd + "/weather-icons.bmp"
 ICON_SPRITE_WIDTH = 16
 ICON_SPRITE_HEIGHT = 16
+# OpenWeatherMap icon codes in sprite sheet row order
+ICON_CODES = ("01", "02", "03", "04", "09", "10", "11", "13", "50")
+DESCRIPTION_STRIP_WIDTH = 320  # pixels; lead-in blank area plus text
+DESCRIPTION_TILE_WIDTH = 8  # pixels; the window's coarse scroll step
 
 
 class MatrixWeatherGraphics(displayio.Group):
     """Creates the Matrix Weather Station display layout, filling the text
     labels and initializing the weather graphic icon."""
 
+    # Sprite sheet tile for each icon name, "01d" to "50n"; the day icon is in
+    #   the first column and the night icon is in the second
+    ICON_TILES = {
+        code + time_of_day: (row * 2) + column
+        for row, code in enumerate(ICON_CODES)
+        for column, time_of_day in enumerate("dn")
+    }
+
     def __init__(
         self,
         display,
@@ -40,9 +55,16 @@ class MatrixWeatherGraphics(displayio.Group):
         units="imperial",
         brightness=1.0,
         gamma=1.0,
+        scroll_speed=10,
+        scroll_hold=0,
+        snapshot=None,
     ):
         super().__init__()
         self.am_pm = am_pm
+        # Description scroll speed in pixels per second and the time to hold
+        #   the text at the left edge of the display during each pass
+        self.scroll_speed = scroll_speed
+        self.scroll_hold = scroll_hold
         print(f"Measurement units set to {units}")
         if units == "metric":
             self.celsius = True
@@ -51,9 +73,6 @@ class MatrixWeatherGraphics(displayio.Group):
             self.celsius = False
             self.meters_speed = False
 
-        # A list of named compass directions for use with wind speed
-        self._compass = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-
         # Define initial display parameters
         self.display = display
         display.rotation = 270
@@ -61,24 +80,21 @@ class MatrixWeatherGraphics(displayio.Group):
         self._disp_gamma = gamma
         self._disp_center = (display.width // 2, display.height // 2)
 
-        self.label_colors = PaletteFader(
-            LABEL_COLORS_REF, self._disp_brightness, gamma=1.0,
-            normalize=False
-        )
+        # The splash and icon palettes are brightness-adjusted together
+        self.faders = PaletteFaderGroup(self._disp_brightness)
 
         # Load an image and create a modifible palette for brightness control
         splash, splash_palette_ref = adafruit_imageload.load(
             "background_sun_clouds.bmp", bitmap=displayio.Bitmap, palette=displayio.Palette
         )
         # Adjust palette colors in proportion to brightness setting
-        splash_normal = PaletteFader(
-            splash_palette_ref, self._disp_brightness, gamma=0.65, normalize=True
-        )
-        splash_sprite = displayio.TileGrid(splash, pixel_shader=splash_normal.palette)
+        splash_palette = self.faders.add(splash_palette_ref, gamma=0.65, normalize=True)
+        splash_sprite = displayio.TileGrid(splash, pixel_shader=splash_palette)
 
         splash_group = displayio.Group()
         splash_group.append(splash_sprite)
         display.show(splash_group)
+        self._primary_shown = False  # True after switching from the splash
 
         self.primary_group = displayio.Group()
         self.primary_group.append(self)
@@ -93,148 +109,282 @@ class MatrixWeatherGraphics(displayio.Group):
         )
         self.icons_ref_palette.make_transparent(0)
 
-        # Instantiate icon palette normalizer object and adjust
-        self.icon_normal = PaletteFader(
-            self.icons_ref_palette, self._disp_brightness, gamma=1.0, normalize=True
+        # Add the icon palette to the faders; adjusted in place and cached
+        self.icon_palette = self.faders.add(
+            self.icons_ref_palette, normalize=True, cache_size=8
         )
         self._icon_sprite = displayio.TileGrid(
             icons,
-            pixel_shader=self.icon_normal.palette,
+            pixel_shader=self.icon_palette,
             tile_width=ICON_SPRITE_WIDTH,
             tile_height=ICON_SPRITE_HEIGHT,
         )
 
-        # Place a blank icon on-screen
+        # Position the icon; blank until set_icon() is called
         self._icon_sprite.x = self._disp_center[0] - 8
         self._icon_sprite.y = 12
-        self.set_icon(None)
+        self._icon_name = None
 
-        # Define the text labels. Add an attribute for the reference color to each.
+        # Define the text labels using the reference colors
         self.temperature_text = Label(DISPLAY_FONT)
         self.temperature_text.anchor_point = (0.5, 0.5)
         self.temperature_text.anchored_position = (self._disp_center[0], 5)
-        self.temperature_text.color = self.label_colors.palette[0]
+        self.temperature_text.color = LABEL_COLORS_REF[0]
         self._fg_group.append(self.temperature_text)
 
-        self.description_text = Label(DISPLAY_FONT)
-        self.description_text.anchor_point = (0.5, 0.5)
-        self.description_text.anchored_position = (self.display.width, 55)
-        self.description_text.color = self.label_colors.palette[1]
-        self._fg_group.append(self.description_text)
+        # The description is pre-rendered into a strip bitmap and scrolled by
+        #   moving a window of strip tiles one pixel (fine scroll) and
+        #   shifting the window along the strip one tile at a time (coarse)
+        self._description_height = DISPLAY_FONT.get_bounding_box()[1]
+        self._description_strip = displayio.Bitmap(
+            DESCRIPTION_STRIP_WIDTH, self._description_height, 2
+        )
+        self._description_palette = displayio.Palette(2)
+        self._description_palette.make_transparent(0)
+        self._description_palette[1] = LABEL_COLORS_REF[1]
+        self._window_tiles = (
+            self.display.width + DESCRIPTION_TILE_WIDTH - 1
+        ) // DESCRIPTION_TILE_WIDTH
+        self._description_window = displayio.TileGrid(
+            self._description_strip,
+            pixel_shader=self._description_palette,
+            width=self._window_tiles + 1,
+            height=1,
+            tile_width=DESCRIPTION_TILE_WIDTH,
+            tile_height=self._description_height,
+        )
+        self._description_window.y = 55 - (self._description_height // 2)
+        self._fg_group.append(self._description_window)
+        self._description = None
+        self._set_description("")
 
         self.humidity_text = Label(DISPLAY_FONT)
         self.humidity_text.anchor_point = (0.5, 0.5)
         self.humidity_text.anchored_position = (self._disp_center[0], 45)
-        self.humidity_text.color = self.label_colors.palette[2]
+        self.humidity_text.color = LABEL_COLORS_REF[2]
         self._fg_group.append(self.humidity_text)
 
         self.wind_text = Label(DISPLAY_FONT)
         self.wind_text.anchor_point = (0.5, 0.5)
         self.wind_text.anchored_position = (self._disp_center[0], 34)
-        self.wind_text.color = self.label_colors.palette[3]
+        self.wind_text.color = LABEL_COLORS_REF[3]
         self._fg_group.append(self.wind_text)
 
+        # Instantiate the text group fader; maps the label colors once
+        self.label_colors = GroupFader(self._fg_group, self._disp_brightness)
+
         # Adjust relative brightness of all display objects
         self.brightness = self._disp_brightness
 
+        # Show the saved weather, if any, until the first weather update
+        if snapshot is not None:
+            record = snapshot.load()
+            if record is not None:
+                self.display_weather(record, saved=True)
+
     def scroll_description(self):
         """Starting at the right-most position on the display, scroll the
-        description text one pixel position to the left. Wrap the text after it
-        fully disappears. Non-blocking method."""
-        self._text_width = self.description_text.bounding_box[2]
-        self.description_text.x = self.description_text.x - 1
-        if self.description_text.x < 0 - self._text_width:
-            self.description_text.x = self.display.width
-
-    def display_weather(self, weather):
-        """Parse the weather information from the JSON data. Checks for the
-        existence of each data element.
-
-        :param dict weather: The retrieved weather JSON dictionary.
+        description text to the left at scroll_speed pixels per second. The
+        position is calculated from the elapsed time, so missed updates are
+        skipped rather than accumulated. The text is held at the left edge of
+        the display for scroll_hold seconds and wraps after it fully
+        disappears. Non-blocking method."""
+        strip_pixels = self._strip_tiles * DESCRIPTION_TILE_WIDTH
+        hold_pixels = self._window_tiles * DESCRIPTION_TILE_WIDTH
+        pass_time = (strip_pixels / self.scroll_speed) + self.scroll_hold
+
+        elapsed = time.monotonic() - self._scroll_start
+        if elapsed >= pass_time:
+            # Start the current pass; skip any missed passes
+            passes = int(elapsed // pass_time)
+            self._scroll_start += passes * pass_time
+            elapsed -= passes * pass_time
+
+        hold_start = hold_pixels / self.scroll_speed
+        if elapsed > hold_start:
+            # Hold the text at the left edge of the display
+            elapsed = max(hold_start, elapsed - self.scroll_hold)
+
+        position = min(int(elapsed * self.scroll_speed), strip_pixels - 1)
+        if position != self._scroll_position:
+            self._scroll_to(position)
+
+    def _scroll_to(self, position):
+        """Move the window to a pixel position along the strip. Shifts the
+        window along the strip when the tile position changes (coarse scroll)
+        and offsets the window within the tile (fine scroll).
+
+        :param int position: The strip pixel position of the display's left
+          edge."""
+        self._scroll_position = position
+        coarse_scroll = position // DESCRIPTION_TILE_WIDTH
+        if coarse_scroll != self._coarse_scroll:
+            self._coarse_scroll = coarse_scroll
+            self._fill_window()
+        self._description_window.x = -(position % DESCRIPTION_TILE_WIDTH)
+
+    def _fill_window(self):
+        """Set the window tiles from the coarse scroll position, wrapping at
+        the end of the strip."""
+        tile = self._coarse_scroll
+        for column in range(self._window_tiles + 1):
+            if tile == self._strip_tiles:
+                tile = 0
+            self._description_window[column] = tile
+            tile += 1
+
+    def _set_description(self, description):
+        """Render the description text into the strip bitmap following a blank
+        lead-in the width of the display. Text that does not fit in the strip
+        is truncated. The strip length, in tiles, is stored for scrolling and
+        the scroll position and pass start time are reset to the lead-in.
+
+        :param str description: The description text.
         """
-        try:
-            # Get the code for the weather icon
-            self.set_icon(weather["weather"][0]["icon"])
-        except:
-            pass
-
-        try:
-            # Get the temperature and apply a measurement unit code
-            temperature = weather["main"]["temp"]
-            print(f"Temperature: {temperature:.0f}°")
-            if self.celsius:
-                self.temperature_text.text = f"{temperature:.1f}° C"
-            else:
-                self.temperature_text.text = f"{temperature:.0f}° F"
-        except:
-            self.temperature_text.text = "--"
-
-        try:
-            # Get the long weather description; "Overcast clouds"
-            description = weather["weather"][0]["description"]
+        self._description = description
+        self._description_strip.fill(0)
+
+        bounding_box = DISPLAY_FONT.get_bounding_box()
+        baseline = bounding_box[1]
+        if len(bounding_box) > 3:
+            baseline += bounding_box[3]
+
+        x = self._window_tiles * DESCRIPTION_TILE_WIDTH
+        for character in description:
+            glyph = DISPLAY_FONT.get_glyph(ord(character))
+            if glyph is None:
+                continue
+            if x + glyph.dx + glyph.width > DESCRIPTION_STRIP_WIDTH:
+                break
+            tiles_across = glyph.bitmap.width // glyph.width
+            glyph_x = (glyph.tile_index % tiles_across) * glyph.width
+            glyph_y = (glyph.tile_index // tiles_across) * glyph.height
+            self._description_strip.blit(
+                x + glyph.dx,
+                max(0, baseline - glyph.height - glyph.dy),
+                glyph.bitmap,
+                x1=glyph_x,
+                y1=glyph_y,
+                x2=glyph_x + glyph.width,
+                y2=glyph_y + glyph.height,
+                skip_index=0,
+            )
+            x += glyph.shift_x
+        self._strip_tiles = (x + DESCRIPTION_TILE_WIDTH - 1) // DESCRIPTION_TILE_WIDTH
+        self._coarse_scroll = 0
+        self._fill_window()
+        self._scroll_to(0)
+        self._scroll_start = time.monotonic()
+
+    def display_weather(self, record, saved=False):
+        """Display the weather record. Missing values are shown as "--" and a
+        missing icon leaves the current icon in place. Only the display
+        elements with changed values are updated. Returns True if any element
+        changed.
+
+        :param list record: The weather record from
+          matrixweather_data.FieldExtractor.extract().
+        :param bool saved: True if the record was restored from a snapshot
+          rather than fetched; "(saved)" is appended to the description.
+          Default is False.
+        """
+        icon_name = record[data.ICON]
+        if icon_name is data.MISSING:
+            icon_name = self._icon_name
+
+        temperature = record[data.TEMPERATURE]
+        if temperature is data.MISSING:
+            temperature_text = "--"
+        elif self.celsius:
+            temperature_text = f"{temperature:.1f}° C"
+        else:
+            temperature_text = f"{temperature:.0f}° F"
+
+        # The long weather description; "Overcast clouds"
+        description = record[data.DESCRIPTION]
+        if not description:
+            description = "--"
+        else:
             description = description[0].upper() + description[1:]
-            print(f"Description: {description}")
-            self.description_text.text = description
-        except:
-            self.description_text.text = "--"
-
-        try:
-            # Get the relative humidity
-            humidity = weather["main"]["humidity"]
-            print(f"Humidity: {humidity:.0f}% RH")
-            self.humidity_text.text = f"{humidity:.0f}%"
-        except:
-            self.humidity_text.text = "--"
-
-        try:
-            # Get the wind direction and determine compass text
-            wind_direction = weather["wind"]["deg"]
-            wind_dir = self._compass[int(((wind_direction + 22.5) % 360) / 45)]
-        except:
-            wind_dir = "--"
-
-        try:
-            # Get the wind speed and merge with direction compass text
-            wind = weather["wind"]["speed"]
-            if wind_dir != "--":
-                self.wind_text.text = f"{wind_dir} {wind:.0f}"
-                if self.meters_speed:
-                    print(f"Wind: {wind} m/s, {wind_direction}° ({wind_dir})")
-                else:
-                    print(f"Wind: {wind} MPH, {wind_direction}° ({wind_dir})")
-            else:
-                print("No wind")
-                self.wind_text.text = "--"
-        except:
-            self.wind_text.text = "--"
-
-        self.display.show(self.primary_group)
+        if saved:
+            description += " (saved)"
+
+        humidity = record[data.HUMIDITY]
+        if humidity is data.MISSING:
+            humidity_text = "--"
+        else:
+            humidity_text = f"{humidity:.0f}%"
+
+        # Merge the wind speed and compass direction
+        wind = record[data.WIND_SPEED]
+        wind_direction = record[data.WIND_DIRECTION]
+        if data.MISSING in (wind, wind_direction):
+            wind_text = "--"
+        else:
+            wind_text = f"{data.compass_direction(wind_direction)} {wind:.0f}"
+
+        # Update only the changed display elements
+        changed = False
+        if icon_name != self._icon_name:
+            self.set_icon(icon_name)
+            changed = True
+        if description != self._description:
+            self._set_description(description)
+            changed = True
+        changed |= self._update_text(self.temperature_text, temperature_text)
+        changed |= self._update_text(self.humidity_text, humidity_text)
+        changed |= self._update_text(self.wind_text, wind_text)
+
+        self.show_primary()
+        return changed
+
+    def show_primary(self):
+        """Switch the display from the splash group to the primary group. The
+        root group is only changed once; later calls do nothing."""
+        if not self._primary_shown:
+            self.display.show(self.primary_group)
+            self._primary_shown = True
+
+    def refresh(self):
+        """Request a display refresh. Only the areas changed since the last
+        refresh are redrawn."""
+        self.display.refresh()
+
+    @staticmethod
+    def _update_text(label, text):
+        """Set the label text if it differs from the displayed text; avoids
+        regenerating the label glyphs. Returns True if the text changed.
+
+        :param Label label: The text label.
+        :param str text: The new label text.
+        """
+        if label.text == text:
+            return False
+        label.text = text
+        return True
 
     def set_icon(self, icon_name):
         """Use icon_name to get the position of the sprite and update
         the current icon. Format is always 2 numbers followed by 'd' or 'n' as
-        the 3rd character.
+        the 3rd character. Does nothing if the icon is unchanged.
 
         :param str icon_name: The icon name returned by openweathermap
         """
-
-        icon_map = ("01", "02", "03", "04", "09", "10", "11", "13", "50")
+        if icon_name == self._icon_name:
+            return
 
         print("Set icon to", icon_name)
-        if self._icon_group:
-            self._icon_group.pop()
-        if icon_name is not None:
-            row = None
-            for index, icon in enumerate(icon_map):
-                if icon == icon_name[0:2]:
-                    row = index
-                    break
-            column = 0
-            if icon_name[2] == "n":
-                column = 1
-            if row is not None:
-                self._icon_sprite[0] = (row * 2) + column
-                self._icon_group.append(self._icon_sprite)
+        self._icon_name = icon_name
+        tile = self.ICON_TILES.get(icon_name)
+        if tile is None:
+            # No icon or an unknown icon; remove the sprite
+            if self._icon_group:
+                self._icon_group.pop()
+            return
+
+        self._icon_sprite[0] = tile
+        if not self._icon_group:
+            self._icon_group.append(self._icon_sprite)
 
     @property
     def brightness(self):
@@ -242,18 +392,14 @@ class MatrixWeatherGraphics(displayio.Group):
 
     @brightness.setter
     def brightness(self, new_brightness=1.0):
-        """Adjust brightness of all display objects; text colors and weather icon.
+        """Adjust brightness of all display objects; text colors, splash image,
+        and weather icon.
 
         :param float new_brightness: The new brightness value.
         """
         if self._disp_brightness != new_brightness:
             self._disp_brightness = new_brightness
 
-            # Adjust brightness of colors in displayio text group
+            # Adjust the palettes; all are updated in place
+            self.faders.brightness = self._disp_brightness
             self.label_colors.brightness = self._disp_brightness
-            for i in range(len(self._fg_group)):
-                self._fg_group[i]._palette[1] = self.label_colors.palette[i]
-
-            # Adjust the icon palette brightness and refresh it
-            self.icon_normal.brightness = self._disp_brightness
-            self._icon_sprite.pixel_shader = self.icon_normal.palette
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+#
+# matrixweather_scheduler.py
+
+"""
+Periodic job scheduler for Matrix Weather. Jobs are kept in a min-heap ordered
+by their next deadline, so the scheduler only looks at the job that is due
+next and sleeps until then. A fixed-rate job is due every period from its
+first deadline; deadlines missed while the code was busy are skipped rather
+than run back-to-back. A fixed-delay job is due one period after its previous
+run finished. Each job keeps timing statistics for checking that the loop
+keeps up.
+"""
+
+import asyncio
+import time
+
+
+class ScheduledJob:
+    """A periodic job and its timing statistics."""
+
+    def __init__(self, name, function, period, fixed_rate, deadline):
+        self.name = name
+        self.function = function
+        self.period = period
+        self.fixed_rate = fixed_rate
+        self.deadline = deadline  # Monotonic time that the job is next due
+        self.runs = 0
+        self.overruns = 0  # Runs that started a period or more after due
+        self.skipped = 0  # Fixed-rate deadlines skipped after an overrun
+        self.max_late = 0  # Longest delay from deadline to start, seconds
+        self.max_run_time = 0  # Longest run, seconds
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.runs} runs, {self.overruns} overruns, "
+            + f"{self.skipped} skipped, max late {self.max_late * 1000:.0f} ms, "
+            + f"max run {self.max_run_time * 1000:.0f} ms"
+        )
+
+
+class Scheduler:
+    """Runs periodic jobs in deadline order."""
+
+    def __init__(self):
+        self._heap = []  # [deadline, sequence, job]; the earliest is first
+        self._sequence = 0  # Keeps equal deadlines in the order scheduled
+        self._jobs = []
+
+    @property
+    def jobs(self):
+        """The scheduled jobs in the order they were added."""
+        return tuple(self._jobs)
+
+    def every(self, period, function, fixed_rate=True, name=None, delay=0):
+        """Schedule a function to be called periodically. Returns the
+        ScheduledJob.
+
+        :param float period: The time between calls in seconds. No default.
+        :param function: The function to call with no arguments. No default.
+        :param bool fixed_rate: True to call every period from the first call;
+          False to wait a period after each call finishes. Default is True.
+        :param str name: The job name used in reports. Default is the
+          function's name.
+        :param float delay: The time until the first call in seconds. Default
+          is 0 seconds."""
+        # pylint: disable=too-many-arguments
+        if name is None:
+            name = function.__name__
+        job = ScheduledJob(
+            name, function, period, fixed_rate, time.monotonic() + delay
+        )
+        self._jobs.append(job)
+        self._push(job)
+        return job
+
+    def run_due(self):
+        """Call each job whose deadline has passed and schedule its next call.
+        Returns the time in seconds until the next deadline. An exception
+        raised by a job is passed on after the job is rescheduled."""
+        heap = self._heap
+        while heap:
+            job = heap[0][2]
+            start = time.monotonic()
+            if job.deadline > start:
+                return job.deadline - start
+            self._pop()
+
+            late = start - job.deadline
+            job.max_late = max(job.max_late, late)
+            if late >= job.period:
+                job.overruns += 1
+            try:
+                job.function()
+            finally:
+                # Keep the job scheduled even if it raised
+                finish = time.monotonic()
+                job.runs += 1
+                job.max_run_time = max(job.max_run_time, finish - start)
+                self._reschedule(job, finish)
+        return None
+
+    def _reschedule(self, job, finish):
+        if job.fixed_rate:
+            job.deadline += job.period
+            if job.deadline <= finish:
+                # Skip the deadlines that passed; keep the phase
+                missed = int((finish - job.deadline) // job.period) + 1
+                job.deadline += missed * job.period
+                job.skipped += missed
+        else:
+            job.deadline = finish + job.period
+        self._push(job)
+
+    async def run(self):
+        """Run the jobs, sleeping until each deadline. Returns when there are
+        no jobs."""
+        while self._heap:
+            await asyncio.sleep(self.run_due())
+
+    def report(self):
+        """The timing statistics of each job, one line per job."""
+        return "\n".join(str(job) for job in self._jobs)
+
+    def _push(self, job):
+        heap = self._heap
+        entry = [job.deadline, self._sequence, job]
+        self._sequence += 1
+        heap.append(entry)
+        index = len(heap) - 1
+        while index:
+            parent = (index - 1) // 2
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = entry
+
+    def _pop(self):
+        heap = self._heap
+        last = heap.pop()
+        if not heap:
+            return
+        size = len(heap)
+        index = 0
+        child = 1
+        while child < size:
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if last <= heap[child]:
+                break
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = last
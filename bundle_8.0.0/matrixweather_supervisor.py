@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+#
+# matrixweather_supervisor.py
+
+"""
+Task supervisor for Matrix Weather. Supervisor.run() runs a task and restarts
+it in place when it fails, keeping the loaded bitmaps, fonts, display groups,
+and WiFi association. Each failure is classified from the exception type and
+the kind of task:
+
+* MEMORY: a MemoryError in any task; the heap is collected before restarting
+* NETWORK: an OSError, RuntimeError, ValueError, or adafruit_requests
+  OutOfRetries in a network task; the task's recover function, such as a
+  reconnect, is called with the category and the exception before restarting
+* RENDERING: an OSError, RuntimeError, ValueError, or IndexError in a display
+  task
+* FATAL: any other exception, such as a programming error
+
+A FATAL failure, or more than the category's restart limit within
+RESTART_WINDOW seconds, is unrecoverable: the exception is raised so that
+code.py can fail over and reset the microcontroller.
+"""
+
+import asyncio
+import gc
+import time
+import adafruit_requests
+
+# Failure categories
+NETWORK = "network"
+RENDERING = "rendering"
+MEMORY = "memory"
+FATAL = "fatal"
+
+# Exception types that a task of each kind can recover from
+RECOVERABLE_ERRORS = {
+    NETWORK: (OSError, RuntimeError, ValueError, adafruit_requests.OutOfRetries),
+    RENDERING: (OSError, RuntimeError, ValueError, IndexError),
+}
+
+# Restarts allowed per failure category within RESTART_WINDOW seconds
+RESTART_LIMITS = {NETWORK: 5, RENDERING: 3, MEMORY: 2, FATAL: 0}
+RESTART_WINDOW = 600
+RESTART_DELAY = 1  # seconds before restarting a failed task
+
+
+def classify(error, kind):
+    """The failure category of an exception raised by a task.
+
+    :param Exception error: The exception. No default.
+    :param str kind: The kind of task; NETWORK or RENDERING. No default."""
+    if isinstance(error, MemoryError):
+        return MEMORY
+    if isinstance(error, RECOVERABLE_ERRORS.get(kind, ())):
+        return kind
+    return FATAL
+
+
+class Supervisor:
+    """Restarts failed tasks in place; escalates unrecoverable failures."""
+
+    def __init__(self):
+        self._failures = {category: [] for category in RESTART_LIMITS}
+
+    @property
+    def failure_counts(self):
+        """The number of recent failures in each category."""
+        return {category: len(times) for category, times in self._failures.items()}
+
+    async def run(self, name, kind, task, recover=None):
+        """Run a task coroutine function; restart it after a recoverable
+        failure. Returns when the task returns.
+
+        :param str name: The task name used in messages. No default.
+        :param str kind: The kind of task; NETWORK or RENDERING. No default.
+        :param task: The coroutine function that runs the task. No default.
+        :param recover: A function called with the failure category and the
+          exception before a restart. Default is None."""
+        category = None  # The category of the last failure
+        failure = None  # The exception of the last failure
+        while True:
+            try:
+                if category is not None and recover is not None:
+                    recover(category, failure)
+                await task()
+                return
+            except Exception as error:  # pylint: disable=broad-except
+                category = classify(error, kind)
+                failure = error
+                if not self._record(category):
+                    print(f"supervisor: {name} {category} failure - {error}")
+                    raise
+                print(
+                    f"supervisor: {name} {category} failure - {error}; "
+                    + f"restarting in {RESTART_DELAY} s"
+                )
+                if category == MEMORY:
+                    gc.collect()
+                await asyncio.sleep(RESTART_DELAY)
+
+    def _record(self, category):
+        """Record a failure. Returns True if a restart is allowed."""
+        now = time.monotonic()
+        times = [t for t in self._failures[category] if now - t < RESTART_WINDOW]
+        times.append(now)
+        self._failures[category] = times
+        return len(times) <= RESTART_LIMITS[category]
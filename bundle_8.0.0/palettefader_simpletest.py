@@ -24,6 +24,7 @@ from adafruit_display_text.label import Label
 from adafruit_display_shapes.rect import Rect
 import adafruit_imageload
 from cedargrove_palettefader.palettefader import PaletteFader
+from cedargrove_palettefader.groupfader import GroupFader
 
 # fmt: off
 # Define a few colors
@@ -110,23 +111,10 @@ sun_palette[0] = YELLOW
 sun = vectorio.Circle(pixel_shader=sun_palette, radius=8, x=30, y=0)
 fg_group.append(sun)
 
-# pylint: disable=protected-access
-# Create foreground group color list from ._palette and .pixel_shader contents
-fg_colors_source = []
-for i, group_object in enumerate(fg_group):
-    if hasattr(group_object, "_palette"):
-        # It's a displayio display_shapes or label object
-        for j, color in enumerate(group_object._palette):
-            fg_colors_source.append(color)
-    elif hasattr(group_object, "pixel_shader"):
-        # It's a bitmap or vectorio object
-        for j, color in enumerate(group_object.pixel_shader):
-            fg_colors_source.append(color)
-
 primary_group.append(fg_group)
 
-# Instantiate foreground color list PaletteFader object
-fg_colors = PaletteFader(fg_colors_source, DISPLAY_BRIGHTNESS, normalize=False)
+# Instantiate foreground group GroupFader object; maps the group's colors once
+fg_colors = GroupFader(fg_group, DISPLAY_BRIGHTNESS, normalize=False)
 
 # ### Primary code loop starts here ###
 
@@ -155,17 +143,5 @@ while True:
 
         # Update foreground group ._palette and .pixel_shader contents
         fg_colors.brightness = DISPLAY_BRIGHTNESS
-        fg_colors_index = 0
-        for i, _ in enumerate(fg_group):
-            if hasattr(fg_group[i], "_palette"):
-                # For a displayio display_shapes or label object
-                for j, _ in enumerate(fg_group[i]._palette):
-                    fg_group[i]._palette[j] = fg_colors.palette[fg_colors_index]
-                    fg_colors_index += 1
-            elif hasattr(fg_group[i], "pixel_shader"):
-                # For a bitmap or vectorio object
-                for j, _ in enumerate(fg_group[i].pixel_shader):
-                    fg_group[i].pixel_shader[j] = fg_colors.palette[fg_colors_index]
-                    fg_colors_index += 1
 
         fader_refresh_timer = time.monotonic()
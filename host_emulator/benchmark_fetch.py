@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`benchmark_fetch.py`
+================================================================================
+
+Compares the two ways of reading the weather fields from a recorded
+OpenWeatherMap response on a host computer using the host emulator:
+
+* fetch_data: the complete response is parsed into a dict by
+  Network.fetch_data() and the fields are extracted with
+  FieldExtractor.extract()
+* streamed: the response body is read in chunks from Network.fetch() and
+  parsed with FieldExtractor.extract_chunks()
+
+The extraction rate and the peak Python heap allocation of each method are
+printed for every response file, and the streamed records are checked against
+the fetch_data records. Exits with status 1 if any record differs.
+
+Usage (from the repository root):
+
+  python host_emulator/benchmark_fetch.py host_emulator/weather_response*.json
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHUNK_SIZES = (16, 64, 256)
+
+
+def measure(function, repeat):
+    """Run a function repeatedly. Returns operations per second, the peak
+    heap allocation in bytes of a separate traced run, and its result. The
+    function's console output is discarded."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _measure(function, repeat)
+
+
+def _measure(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return repeat / elapsed, peak, result
+
+
+def main():
+    """Benchmark and compare the extraction methods."""
+    # pylint: disable=import-outside-toplevel
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "responses", nargs="*", default=[os.path.join(HOST_DIR, "weather_response.json")]
+    )
+    parser.add_argument("--bundle", default="bundle_8.0.0")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    bundle_dir = os.path.abspath(os.path.join(HOST_DIR, "..", args.bundle))
+    sys.path[0:0] = [os.path.join(HOST_DIR, "lib"), bundle_dir]
+
+    import adafruit_requests
+    from adafruit_matrixportal.network import Network
+    import matrixweather_data
+
+    network = Network()
+    fields = matrixweather_data.FieldExtractor()
+    mismatches = 0
+
+    print(f"{'response':<28} {'method':<16} {'extracts/s':>10} {'peak KB':>8}")
+    for path in args.responses:
+        adafruit_requests.Session.response_file = path
+        name = os.path.basename(path)
+
+        def parsed():
+            return fields.extract(network.fetch_data("", json_path=([],)))
+
+        rate, peak, expected = measure(parsed, args.repeat)
+        print(f"{name:<28} {'fetch_data':<16} {rate:>10.0f} {peak / 1024:>8.1f}")
+
+        for chunk_size in CHUNK_SIZES:
+
+            def streamed(chunk_size=chunk_size):
+                response = network.fetch("")
+                try:
+                    network.check_response(response)
+                    return fields.extract_chunks(response.iter_content(chunk_size))
+                finally:
+                    response.close()
+
+            rate, peak, record = measure(streamed, args.repeat)
+            method = f"streamed, {chunk_size} B"
+            print(f"{name:<28} {method:<16} {rate:>10.0f} {peak / 1024:>8.1f}")
+            if record != expected:
+                print(f"  record differs: {record} != {expected}")
+                mismatches += 1
+        print(f"  {expected}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`benchmark_palettefader.py`
+================================================================================
+
+Benchmarks the PaletteFader variants of a bundle on a host computer using the
+host emulator's displayio. Construction and brightness-sweep fade_normalize()
+times are reported as operations per second with the peak Python heap
+allocation for each palette size and gamma value. Every variant's adjusted
+palettes (colors and transparency) are compared with the first variant; the
+exit status is 1 if any differ.
+
+When ulab is not installed, host numpy stands in for ulab.numpy.
+
+Usage (from the repository root; requires numpy):
+
+  python host_emulator/benchmark_palettefader.py --bundle bundle_8.0.0
+  python host_emulator/benchmark_palettefader.py --bundle bundle_7.x.x
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# PaletteFader variant module files for each bundle
+VARIANTS = {
+    "bundle_7.x.x": (
+        "cedargrove_palettefader.py",
+        "cedargrove_palettefader_mp.py",
+        "cedargrove_palettefader_ulab.py",
+    ),
+    "bundle_8.0.0": (
+        "cedargrove_palettefader/palettefader.py",
+        "cedargrove_palettefader/palettefader_ulab.py",
+    ),
+}
+
+PALETTE_SIZES = (4, 16, 256)
+GAMMAS = (0.55, 1.0, 1.5)
+BRIGHTNESS_SWEEP = [level / 100 for level in range(5, 101)]  # 0.05 to 1.00
+
+
+def load_variant(path):
+    """Import a PaletteFader variant module from a file path."""
+    name = "variant_" + os.path.splitext(path)[0].replace(os.sep, "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def source_palette(displayio, size):
+    """A displayio palette of random colors with every fifth index
+    transparent."""
+    generator = random.Random(size)
+    palette = displayio.Palette(size)
+    for index in range(size):
+        palette[index] = generator.randrange(0x1000000)
+        if not index % 5:
+            palette.make_transparent(index)
+    return palette
+
+
+def palette_state(palette):
+    """The colors and transparency of a palette as a comparable tuple."""
+    return tuple(
+        (palette[index], palette.is_transparent(index)) for index in range(len(palette))
+    )
+
+
+def measure(function, repeat):
+    """Run a function repeatedly. Returns operations per second and the peak
+    heap allocation in bytes of a separate traced run."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return repeat / elapsed, peak
+
+
+def benchmark(name, module, displayio, repeat):
+    """Print the construction and fade timing of a variant."""
+    for size in PALETTE_SIZES:
+        source = source_palette(displayio, size)
+        for gamma in GAMMAS:
+            build_rate, build_peak = measure(
+                lambda: module.PaletteFader(source, 0.5, gamma, normalize=True),
+                repeat,
+            )
+            fader = module.PaletteFader(source, 0.5, gamma, normalize=True)
+
+            def sweep(fader=fader):
+                for brightness in BRIGHTNESS_SWEEP:
+                    fader.brightness = brightness
+
+            sweep_rate, sweep_peak = measure(sweep, max(1, repeat // 10))
+            print(
+                f"{name:<44} {size:>4} {gamma:>5} "
+                f"{build_rate:>10.0f} {build_peak / 1024:>8.1f} "
+                f"{sweep_rate * len(BRIGHTNESS_SWEEP):>10.0f} {sweep_peak / 1024:>8.1f}"
+            )
+
+
+def compare(modules, displayio):
+    """Compare each variant's adjusted palettes with the first variant.
+    Returns the number of differing palettes."""
+    mismatches = 0
+    reference_name, reference = modules[0]
+    for name, module in modules[1:]:
+        count = 0
+        for size in PALETTE_SIZES:
+            source = source_palette(displayio, size)
+            for normalize in (False, True):
+                for gamma in GAMMAS:
+                    expected = reference.PaletteFader(source, 1.0, gamma, normalize)
+                    actual = module.PaletteFader(source, 1.0, gamma, normalize)
+                    for brightness in BRIGHTNESS_SWEEP:
+                        expected.brightness = brightness
+                        actual.brightness = brightness
+                        if palette_state(expected.palette) != palette_state(
+                            actual.palette
+                        ):
+                            count += 1
+        status = "identical" if not count else f"{count} palettes differ"
+        print(f"{name} vs {reference_name}: {status}")
+        mismatches += count
+    return mismatches
+
+
+def main():
+    """Benchmark and compare the variants."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--bundle", default="bundle_8.0.0", choices=VARIANTS)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(HOST_DIR, "lib"))
+    import displayio  # pylint: disable=import-outside-toplevel
+
+    try:
+        import ulab  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        import types  # pylint: disable=import-outside-toplevel
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        sys.modules["ulab"] = types.SimpleNamespace(numpy=numpy)
+        sys.modules["ulab.numpy"] = numpy
+
+    bundle_dir = os.path.join(HOST_DIR, "..", args.bundle)
+    modules = [
+        (path, load_variant(os.path.join(bundle_dir, path)))
+        for path in VARIANTS[args.bundle]
+    ]
+
+    print(
+        f"{'variant':<44} {'size':>4} {'gamma':>5} "
+        f"{'builds/s':>10} {'peak KB':>8} {'fades/s':>10} {'peak KB':>8}"
+    )
+    for name, module in modules:
+        benchmark(name, module, displayio, args.repeat)
+    print()
+    return 1 if compare(modules, displayio) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`benchmark_scroll.py`
+================================================================================
+
+Measures the per-tick cost of scrolling the weather description on a host
+computer using the host emulator. Three methods are compared for short and
+long descriptions:
+
+* label: the original Label scroll; bounding_box is queried every tick
+* label, cached width: the Label scroll with the text width stored when the
+  description changes
+* strip window, stepped: the bundle's MatrixWeatherGraphics strip window
+  moved one pixel per tick
+* strip window, timed: MatrixWeatherGraphics.scroll_description(), which
+  positions the window from the elapsed time; the cost of each loop call
+
+With --refresh, each tick also includes a display refresh.
+
+Usage (from the repository root; requires numpy):
+
+  python host_emulator/benchmark_scroll.py --bundle bundle_8.0.0
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import argparse
+import os
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DESCRIPTIONS = ("Mist", "Thunderstorm with heavy drizzle")
+
+
+def time_ticks(scroll, display, ticks, refresh):
+    """Run the scroll function for a number of ticks. Returns microseconds
+    per tick."""
+    start = time.perf_counter()
+    for _ in range(ticks):
+        scroll()
+        if refresh:
+            display.refresh()
+    return 1e6 * (time.perf_counter() - start) / ticks
+
+
+def label_scroll(label, display, cached):
+    """Return the original Label scroll function; the text width is either
+    queried every tick or stored once."""
+    text_width = label.bounding_box[2]
+
+    def scroll():
+        width = text_width if cached else label.bounding_box[2]
+        label.x = label.x - 1
+        if label.x < 0 - width:
+            label.x = display.width
+
+    return scroll
+
+
+def strip_step(gfx, tile_width):
+    """Return a function that moves the strip window one pixel per call."""
+    # pylint: disable=protected-access
+    strip_pixels = gfx._strip_tiles * tile_width
+    position = [0]
+
+    def scroll():
+        position[0] = (position[0] + 1) % strip_pixels
+        gfx._scroll_to(position[0])
+
+    return scroll
+
+
+def main():
+    """Print the per-tick scroll cost of each method."""
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--bundle", default="bundle_8.0.0")
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--refresh", action="store_true")
+    args = parser.parse_args()
+
+    bundle_dir = os.path.abspath(os.path.join(HOST_DIR, "..", args.bundle))
+    sys.path[0:0] = [os.path.join(HOST_DIR, "lib"), bundle_dir]
+    os.chdir(bundle_dir)
+
+    import displayio
+    import terminalio
+    from adafruit_display_text.label import Label
+    from adafruit_matrixportal.matrix import Matrix
+    import matrixweather_graphics
+    import matrixweather_data
+
+    display = Matrix().display
+    gfx = matrixweather_graphics.MatrixWeatherGraphics(display)
+    display.show(gfx.primary_group)
+
+    print(f"{'method':<22} {'description':<32} {'us/tick':>8}")
+    for description in DESCRIPTIONS:
+        for cached in (False, True):
+            label = Label(terminalio.FONT, text=description)
+            label.anchor_point = (0.5, 0.5)
+            label.anchored_position = (display.width, 55)
+            group = displayio.Group()
+            group.append(label)
+            display.show(group)
+            cost = time_ticks(
+                label_scroll(label, display, cached), display, args.ticks, args.refresh
+            )
+            method = "label, cached width" if cached else "label"
+            print(f"{method:<22} {description:<32} {cost:>8.2f}")
+
+        display.show(gfx.primary_group)
+        gfx.display_weather(
+            matrixweather_data.FieldExtractor().extract(
+                {"weather": [{"description": description}]}
+            )
+        )
+        cost = time_ticks(
+            strip_step(gfx, matrixweather_graphics.DESCRIPTION_TILE_WIDTH),
+            display,
+            args.ticks,
+            args.refresh,
+        )
+        print(f"{'strip window, stepped':<22} {description:<32} {cost:>8.2f}")
+        cost = time_ticks(gfx.scroll_description, display, args.ticks, args.refresh)
+        print(f"{'strip window, timed':<22} {description:<32} {cost:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
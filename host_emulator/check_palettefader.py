@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`check_palettefader.py`
+================================================================================
+
+Checks the transparency handling of a bundle's PaletteFader on a host computer
+using the host emulator's displayio. A 256-color source palette with most
+indices transparent is faded through a range of brightness levels, both as a
+displayio palette and as a color list with None entries, with in_place False
+and True. Every index of each adjusted palette is checked for its expected
+color and transparency; the exit status is 1 if any check fails.
+
+Usage (from the repository root):
+
+  python host_emulator/check_palettefader.py --bundle bundle_8.0.0
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import argparse
+import os
+import random
+import sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PALETTE_SIZE = 256
+OPAQUE_EVERY = 7  # Every seventh index is opaque; the rest are transparent
+GAMMAS = (0.65, 1.0, 1.5)
+
+# Brightness levels in 1/64 increments, where the lookup tables are exact
+BRIGHTNESS_LEVELS = [level / 64 for level in (64, 40, 4, 17, 64)]
+
+
+def source_colors():
+    """The random source colors and the set of transparent indices."""
+    generator = random.Random(PALETTE_SIZE)
+    colors = [generator.randrange(0x1000000) for _ in range(PALETTE_SIZE)]
+    transparent = {index for index in range(PALETTE_SIZE) if index % OPAQUE_EVERY}
+    return colors, transparent
+
+
+def expected_color(color, reference_max, brightness, gamma):
+    """Adjust a color with the original PaletteFader formula."""
+    factor = round((0xFF / reference_max) * brightness, 3)
+    adjusted = 0
+    for shift in (16, 8, 0):
+        value = (color >> shift) & 0xFF
+        adjusted += int(min((value * factor) ** gamma, 0xFF)) << shift
+    return adjusted
+
+
+def check_fader(fader, colors, transparent, normalize):
+    """Check every index of the fader's palette at each brightness level.
+    Returns the number of failed checks."""
+    reference_max = 0xFF
+    if normalize:
+        reference_max = max(
+            max((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+            for color in colors
+        )
+    failures = 0
+    for brightness in BRIGHTNESS_LEVELS:
+        fader.brightness = brightness
+        palette = fader.palette
+        for index, color in enumerate(colors):
+            expected = expected_color(color, reference_max, brightness, fader.gamma)
+            if palette[index] != expected:
+                print(f"  index {index}: color {palette[index]:06X} != {expected:06X}")
+                failures += 1
+            if palette.is_transparent(index) != (index in transparent):
+                print(f"  index {index}: transparency is not preserved")
+                failures += 1
+    return failures
+
+
+def main():
+    """Run the checks and report the result of each."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--bundle", default="bundle_8.0.0")
+    args = parser.parse_args()
+
+    bundle_dir = os.path.abspath(os.path.join(HOST_DIR, "..", args.bundle))
+    sys.path[0:0] = [os.path.join(HOST_DIR, "lib"), bundle_dir]
+
+    # pylint: disable=import-outside-toplevel
+    import displayio
+    from cedargrove_palettefader.palettefader import PaletteFader
+
+    colors, transparent = source_colors()
+    palette = displayio.Palette(PALETTE_SIZE)
+    for index, color in enumerate(colors):
+        palette[index] = color
+        if index in transparent:
+            palette.make_transparent(index)
+    color_list = [
+        None if index in transparent else color for index, color in enumerate(colors)
+    ]
+    # None list entries are faded as black
+    list_colors = [0 if color is None else color for color in color_list]
+
+    total = 0
+    for source, name, reference in (
+        (palette, "palette", colors),
+        (color_list, "list", list_colors),
+    ):
+        for in_place in (False, True):
+            for normalize in (False, True):
+                for gamma in GAMMAS:
+                    fader = PaletteFader(
+                        source, 1.0, gamma, normalize, in_place=in_place
+                    )
+                    failures = check_fader(fader, reference, transparent, normalize)
+                    status = "ok" if not failures else f"{failures} failed"
+                    print(
+                        f"{name:<8} in_place={in_place!s:<5} "
+                        f"normalize={normalize!s:<5} gamma={gamma:<4} {status}"
+                    )
+                    total += failures
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_display_text.label` (host emulator)
+================================================================================
+
+A host-side stand-in for the adafruit_display_text Label class. The text is
+drawn with the font's glyph tiles in a single TileGrid; color index 0 is the
+transparent background and index 1 is the text color.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import displayio
+
+
+class Label(displayio.Group):
+    """A single line text label."""
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, font, *, text="", color=0xFFFFFF, x=0, y=0, **kwargs):
+        super().__init__(x=x, y=y)
+        self.font = font
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._anchor_point = (0, 0)
+        self._anchored_position = None
+        self._tilegrid = None
+        self._text = None
+        self.color = color
+        self.text = text
+
+    @property
+    def color(self):
+        """The text color."""
+        if self._palette.is_transparent(1):
+            return None
+        return self._palette[1]
+
+    @color.setter
+    def color(self, new_color):
+        if new_color is None:
+            self._palette.make_transparent(1)
+        else:
+            self._palette[1] = new_color
+            self._palette.make_opaque(1)
+
+    @property
+    def text(self):
+        """The label text."""
+        return self._text
+
+    @text.setter
+    def text(self, new_text):
+        if new_text == self._text:
+            return
+        self._text = new_text
+        if self._tilegrid is not None:
+            self.remove(self._tilegrid)
+            self._tilegrid = None
+        if new_text:
+            glyph_width, glyph_height = self.font.get_bounding_box()
+            self._tilegrid = displayio.TileGrid(
+                self.font.bitmap,
+                pixel_shader=self._palette,
+                width=len(new_text),
+                height=1,
+                tile_width=glyph_width,
+                tile_height=glyph_height,
+            )
+            for index, character in enumerate(new_text):
+                self._tilegrid[index] = self.font.get_glyph(ord(character)).tile_index
+            self.append(self._tilegrid)
+        self._update_position()
+
+    @property
+    def bounding_box(self):
+        """The text bounding box; (x, y, width, height)."""
+        glyph_width, glyph_height = self.font.get_bounding_box()
+        if not self._text:
+            return (0, 0, 0, glyph_height)
+        return (0, 0, glyph_width * len(self._text), glyph_height)
+
+    @property
+    def anchor_point(self):
+        """The relative anchor position within the bounding box."""
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, new_anchor_point):
+        self._anchor_point = new_anchor_point
+        self._update_position()
+
+    @property
+    def anchored_position(self):
+        """The display position of the anchor point."""
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, new_position):
+        self._anchored_position = new_position
+        self._update_position()
+
+    def _update_position(self):
+        if self._anchored_position is None:
+            return
+        _, _, width, height = self.bounding_box
+        self.x = int(self._anchored_position[0] - (self._anchor_point[0] * width))
+        self.y = int(self._anchored_position[1] - (self._anchor_point[1] * height))
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_esp32spi.adafruit_esp32spi` (host emulator)
+================================================================================
+
+A host-side stand-in for the ESP32SPI co-processor control class. The host is
+always connected; reset() only counts the resets.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+class ESP_SPIcontrol:  # pylint: disable=invalid-name
+    """The ESP32 WiFi co-processor."""
+
+    def __init__(
+        self, spi, cs_dio, ready_dio, reset_dio, gpio0_dio=None, *, debug=False
+    ):
+        # pylint: disable=too-many-arguments,unused-argument
+        self.reset_count = 0
+
+    @property
+    def is_connected(self):
+        """True; the host is always connected."""
+        return True
+
+    def reset(self):
+        """Hard reset the co-processor; counted."""
+        self.reset_count += 1
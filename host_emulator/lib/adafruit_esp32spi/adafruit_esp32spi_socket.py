@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_esp32spi.adafruit_esp32spi_socket` (host emulator)
+================================================================================
+
+A host-side stand-in for the ESP32SPI socket pool module. The host
+adafruit_requests stand-in opens its own connections, so the pool is only
+passed through to Session.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+_the_interface = None  # pylint: disable=invalid-name
+
+
+def set_interface(iface):
+    """Set the ESP32SPI interface used by the sockets; ignored."""
+    global _the_interface  # pylint: disable=global-statement,invalid-name
+    _the_interface = iface
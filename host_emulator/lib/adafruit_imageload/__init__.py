@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_imageload` (host emulator)
+================================================================================
+
+A host-side stand-in for adafruit_imageload. Loads uncompressed 1, 4, and 8
+bit indexed BMP files.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import struct
+
+
+def load(filename, *, bitmap=None, palette=None):
+    """Load an indexed BMP file. Returns a (bitmap, palette) tuple.
+
+    :param str filename: The BMP file name.
+    :param type bitmap: The bitmap class; displayio.Bitmap.
+    :param type palette: The palette class; displayio.Palette."""
+    # pylint: disable=too-many-locals
+    with open(filename, "rb") as file:
+        data = file.read()
+    if data[0:2] != b"BM":
+        raise ValueError("Unsupported image format")
+
+    data_start = struct.unpack_from("<I", data, 10)[0]
+    header_size = struct.unpack_from("<I", data, 14)[0]
+    width, height = struct.unpack_from("<ii", data, 18)
+    bits_per_pixel = struct.unpack_from("<H", data, 28)[0]
+    compression = struct.unpack_from("<I", data, 30)[0]
+    colors = struct.unpack_from("<I", data, 46)[0] or (1 << bits_per_pixel)
+    if bits_per_pixel not in (1, 4, 8) or compression:
+        raise NotImplementedError("Only uncompressed indexed BMP files are supported")
+
+    image_palette = None
+    if palette is not None:
+        image_palette = palette(colors)
+        table = 14 + header_size
+        for index in range(colors):
+            blue, green, red = data[table + (index * 4) : table + (index * 4) + 3]
+            image_palette[index] = (red << 16) + (green << 8) + blue
+
+    image_bitmap = None
+    if bitmap is not None:
+        rows = abs(height)
+        image_bitmap = bitmap(width, rows, colors)
+        stride = (((width * bits_per_pixel) + 31) // 32) * 4
+        mask = (1 << bits_per_pixel) - 1
+        for row in range(rows):
+            y = rows - 1 - row if height > 0 else row
+            offset = data_start + (row * stride)
+            for x in range(width):
+                bit = x * bits_per_pixel
+                byte = data[offset + (bit // 8)]
+                shift = 8 - bits_per_pixel - (bit % 8)
+                image_bitmap[x, y] = (byte >> shift) & mask
+    return image_bitmap, image_palette
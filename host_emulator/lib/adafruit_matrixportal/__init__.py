@@ -0,0 +1,4 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""Host emulator stand-in for the adafruit_matrixportal library."""
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_matrixportal.matrix` (host emulator)
+================================================================================
+
+A host-side stand-in for the Matrix class. The display is a 64x32 host
+displayio.Display that renders into a numpy framebuffer.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import displayio
+
+
+class Matrix:  # pylint: disable=too-few-public-methods
+    """An RGB LED matrix panel display."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        *,
+        width=64,
+        height=32,
+        bit_depth=2,
+        alt_addr_pins=None,
+        color_order="RGB",
+        serpentine=True,
+        tile_rows=1,
+        rotation=0,
+    ):
+        self.bit_depth = bit_depth
+        self.display = displayio.Display(
+            width * tile_rows if not serpentine else width,
+            height * tile_rows,
+            rotation=rotation,
+        )
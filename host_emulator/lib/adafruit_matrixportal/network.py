@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_matrixportal.network` (host emulator)
+================================================================================
+
+A host-side stand-in for the Network class. fetch() sends requests through a
+kept-alive adafruit_requests stand-in session, which returns the recorded
+response or forwards the request to a local server. fetch_data() returns the
+recorded response. The response file, server, and simulated latency are set
+with the adafruit_requests.Session class attributes or the environment
+variables described there.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import json
+import time
+import adafruit_requests
+
+
+class HttpError(Exception):
+    """HTTP error response."""
+
+    def __init__(self, message, response):
+        super().__init__(message)
+        self.response = response
+
+
+class Network:
+    """A network connection that serves recorded JSON responses."""
+
+    def __init__(
+        self,
+        *,
+        status_neopixel=None,
+        esp=None,
+        external_spi=None,
+        extract_values=True,
+        debug=False,
+    ):
+        # pylint: disable=too-many-arguments,unused-argument
+        self._debug = debug
+        self._session = adafruit_requests.Session(None)
+        self.fetch_count = 0
+        self.fetch_time = 0.0  # Total seconds spent in fetch_data()
+
+    @property
+    def is_connected(self):
+        """True; the host is always connected."""
+        return True
+
+    def connect(self, max_attempts=10):
+        """Connect to the network; ignored."""
+
+    def get_local_time(self, location=None, max_attempts=10):
+        """Set the local time; ignored."""
+
+    def fetch(self, url, *, headers=None, timeout=10):
+        """Return the adafruit_requests stand-in's response object."""
+        start = time.monotonic()
+        print("Retrieving data...", end="")
+        response = self._session.get(url, headers=headers, timeout=timeout)
+        self.fetch_count += 1
+        self.fetch_time += time.monotonic() - start
+        return response
+
+    @staticmethod
+    def check_response(response):
+        """Raise HttpError unless the response status is OK."""
+        if response.status_code != 200:
+            raise HttpError(
+                f"Code {response.status_code}: {response.reason.decode('utf-8')}",
+                response,
+            )
+        print("Reply is OK!")
+
+    def fetch_data(
+        self, url, *, headers=None, json_path=None, regexp_path=None, timeout=10
+    ):
+        """Return the recorded response. A json_path of ([],) returns the
+        complete JSON document."""
+        # pylint: disable=too-many-arguments,unused-argument
+        start = time.monotonic()
+        if self._debug:
+            print("Retrieving data...", end="")
+        session = adafruit_requests.Session
+        time.sleep(session.latency)
+        with open(session.response_file, encoding="utf-8") as file:
+            value = json.load(file)
+        if json_path:
+            results = []
+            for path in json_path:
+                result = value
+                for key in path:
+                    result = result[key]
+                results.append(result)
+            value = results[0] if len(results) == 1 else results
+        if self._debug:
+            print("Reply is OK!")
+        self.fetch_count += 1
+        self.fetch_time += time.monotonic() - start
+        return value
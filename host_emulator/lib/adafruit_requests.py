@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_requests` (host emulator)
+================================================================================
+
+A host-side stand-in for the adafruit_requests Session. Without a server, get()
+returns the recorded response file. If the server attribute or the
+MATRIXWEATHER_SERVER environment variable is set to a "host:port" address, the
+request's path, query, and headers are sent to that HTTP server instead, such
+as weather_server.py. Like the ESP32SPI sessions, the connection is kept alive
+and reused once a response is closed; a reused connection that the server
+has dropped is replaced and the request sent again; if the new connection
+fails too, OutOfRetries is raised as by adafruit_requests 1.12. A request on a
+connection whose previous response was not closed raises RuntimeError.
+
+The response file and a simulated request latency are set with the class
+attributes or the MATRIXWEATHER_RESPONSE and MATRIXWEATHER_LATENCY environment
+variables.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import http.client
+import io
+import json
+import os
+import time
+from urllib.parse import quote, urlsplit
+
+_HOST_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+class OutOfRetries(Exception):
+    """Raised when a request fails on two sockets in a row."""
+
+
+class Response:
+    """An HTTP response read from a file-like body."""
+
+    def __init__(self, status, reason, headers, body, socket):
+        # pylint: disable=too-many-arguments
+        self.status_code = status
+        self.reason = reason.encode("utf-8")
+        self.headers = {name.lower(): value for name, value in headers}
+        self.socket = socket  # The connection; None once the response is closed
+        self.bytes_read = 0  # Body bytes handed out by iter_content()
+        self._body = body
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        """Yield the body in chunks of up to chunk_size bytes."""
+        # pylint: disable=unused-argument
+        while True:
+            chunk = self._body.read(chunk_size)
+            if not chunk:
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def json(self):
+        """The parsed body."""
+        return json.loads(self._body.read())
+
+    def close(self):
+        """Read the rest of the body and release the connection for reuse."""
+        if self.socket is None:
+            return
+        self._body.read()
+        self._body.close()
+        self.socket = None
+
+
+class Session:
+    """An HTTP session that keeps its connection alive between requests."""
+
+    response_file = os.environ.get(
+        "MATRIXWEATHER_RESPONSE", os.path.join(_HOST_DIR, "weather_response.json")
+    )
+    latency = float(os.environ.get("MATRIXWEATHER_LATENCY", "0"))
+    server = os.environ.get("MATRIXWEATHER_SERVER")
+
+    def __init__(self, socket_pool, ssl_context=None):
+        # pylint: disable=unused-argument
+        self._connection = None
+        self.connect_count = 0  # Connections opened to the server
+
+    def get(self, url, headers=None, stream=False, timeout=60):
+        """Send a GET request and return the Response."""
+        # pylint: disable=unused-argument
+        time.sleep(self.latency)
+        if not self.server:
+            with open(self.response_file, "rb") as file:
+                body = file.read()
+            headers = (
+                ("Content-Type", "application/json; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+            )
+            body = io.BytesIO(body)
+            return Response(200, "OK", headers, body, body)
+
+        parts = urlsplit(url)
+        path = parts.path + ("?" + parts.query if parts.query else "")
+        path = quote(path or "/", "/?&=,%")
+        retried = self._connection is not None
+        for reused in (retried, False):
+            if not reused:
+                self._connection = http.client.HTTPConnection(
+                    self.server, timeout=timeout
+                )
+                self.connect_count += 1
+            try:
+                self._connection.request("GET", path, headers=headers or {})
+                response = self._connection.getresponse()
+                break
+            except http.client.ImproperConnectionState as error:
+                # The previous response on the connection was not closed
+                raise RuntimeError("Socket already used") from error
+            except (http.client.RemoteDisconnected, ConnectionError) as error:
+                self._connection.close()
+                self._connection = None
+                if reused:
+                    continue
+                if retried:
+                    raise OutOfRetries("Repeated socket failures") from error
+                raise OSError(f"Failed to connect to {self.server}") from error
+        return Response(
+            response.status,
+            response.reason,
+            response.getheaders(),
+            response,
+            self._connection,
+        )
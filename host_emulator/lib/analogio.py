@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`analogio` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython analogio module. AnalogIn.value is
+a stored 16-bit value; mid-scale by default.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+class AnalogIn:  # pylint: disable=too-few-public-methods
+    """An analog input pin."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.value = 0x8000
+        self.reference_voltage = 3.3
+
+    def deinit(self):
+        """Release the pin."""
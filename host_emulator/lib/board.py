@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`board` (host emulator)
+================================================================================
+
+Matrix Portal M4 pin names for the host emulator.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+# pylint: disable=invalid-name
+A0 = "A0"
+A1 = "A1"
+A2 = "A2"
+A3 = "A3"
+A4 = "A4"
+BUTTON_UP = "BUTTON_UP"
+BUTTON_DOWN = "BUTTON_DOWN"
+LED = "LED"
+NEOPIXEL = "NEOPIXEL"
+ESP_CS = "ESP_CS"
+ESP_BUSY = "ESP_BUSY"
+ESP_RESET = "ESP_RESET"
+SCK = "SCK"
+MOSI = "MOSI"
+MISO = "MISO"
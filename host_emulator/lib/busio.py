@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`busio` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython busio module.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+class SPI:  # pylint: disable=too-few-public-methods
+    """An SPI bus; the pins are stored but not used."""
+
+    def __init__(self, clock, MOSI=None, MISO=None):  # pylint: disable=invalid-name
+        self.clock = clock
+        self.mosi = MOSI
+        self.miso = MISO
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`digitalio` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython digitalio module. Inputs with a
+pull-up read True (button released) unless value is assigned by the host.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+class Direction:  # pylint: disable=too-few-public-methods
+    """Pin direction."""
+
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class Pull:  # pylint: disable=too-few-public-methods
+    """Input pull resistor."""
+
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class DigitalInOut:
+    """A digital pin; value is stored rather than read from hardware."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self.value = False
+
+    def switch_to_input(self, pull=None):
+        """Set the pin to input with an optional pull resistor."""
+        self.direction = Direction.INPUT
+        self.pull = pull
+        self.value = pull == Pull.UP
+
+    def switch_to_output(self, value=False, drive_mode=None):
+        """Set the pin to output."""
+        self.direction = Direction.OUTPUT
+        self.value = value
+
+    def deinit(self):
+        """Release the pin."""
@@ -0,0 +1,319 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`displayio` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython displayio module. Groups, TileGrids,
+Bitmaps, and Palettes behave like their CircuitPython counterparts; a Display
+renders its root group into a numpy framebuffer of 24-bit RGB values when
+refresh() is called.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import time
+import numpy
+
+# Displays created by the running program; used by the host runner
+displays = []
+
+
+class Palette:
+    """A list of 24-bit RGB colors with per-index transparency."""
+
+    def __init__(self, color_count):
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __setitem__(self, index, color):
+        if isinstance(color, (tuple, list, bytes, bytearray)):
+            color = (color[0] << 16) + (color[1] << 8) + color[2]
+        self._colors[index] = int(color) & 0xFFFFFF
+
+    def __iter__(self):
+        return iter(list(self._colors))
+
+    def make_transparent(self, index):
+        """Set the color index transparent."""
+        self._transparent[index] = True
+
+    def make_opaque(self, index):
+        """Set the color index opaque."""
+        self._transparent[index] = False
+
+    def is_transparent(self, index):
+        """True if the color index is transparent."""
+        return self._transparent[index]
+
+
+class ColorConverter:
+    """Passes 24-bit RGB bitmap values through unchanged."""
+
+    def __init__(self, *, input_colorspace=None, dither=False):
+        self.dither = dither
+
+
+class Bitmap:
+    """A two-dimensional array of color index values held in a numpy array."""
+
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self._value_count = value_count
+        dtype = numpy.uint8 if value_count <= 0x100 else numpy.uint32
+        self.data = numpy.zeros((height, width), dtype=dtype)
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return int(self.data[index[1], index[0]])
+        return int(self.data[index // self.width, index % self.width])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple):
+            self.data[index[1], index[0]] = value
+        else:
+            self.data[index // self.width, index % self.width] = value
+
+    def fill(self, value):
+        """Set every bitmap value."""
+        self.data[:, :] = value
+
+    def blit(
+        self, x, y, source_bitmap, *, x1=0, y1=0, x2=None, y2=None, skip_index=None
+    ):
+        """Copy a region of the source bitmap to the x, y position. Source
+        values equal to skip_index are not copied."""
+        # pylint: disable=too-many-arguments
+        x2 = source_bitmap.width if x2 is None else x2
+        y2 = source_bitmap.height if y2 is None else y2
+        width = min(x2 - x1, self.width - x)
+        height = min(y2 - y1, self.height - y)
+        if width <= 0 or height <= 0:
+            return
+        source = source_bitmap.data[y1 : y1 + height, x1 : x1 + width]
+        target = self.data[y : y + height, x : x + width]
+        if skip_index is None:
+            target[:, :] = source
+        else:
+            mask = source != skip_index
+            target[mask] = source[mask]
+
+
+class TileGrid:
+    """A grid of bitmap tiles colored by a pixel shader."""
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        bitmap,
+        *,
+        pixel_shader,
+        width=1,
+        height=1,
+        tile_width=None,
+        tile_height=None,
+        default_tile=0,
+        x=0,
+        y=0,
+    ):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.tile_width = tile_width or bitmap.width
+        self.tile_height = tile_height or bitmap.height
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._tiles = [default_tile] * (width * height)
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        return self._tiles[index]
+
+    def __setitem__(self, index, tile):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        self._tiles[index] = tile
+
+
+class Group:
+    """A list of layers with a shared position offset."""
+
+    def __init__(self, *, scale=1, x=0, y=0):
+        self._layers = []
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer):
+        self._layers[index] = layer
+
+    def __delitem__(self, index):
+        del self._layers[index]
+
+    def __iter__(self):
+        return iter(list(self._layers))
+
+    def append(self, layer):
+        """Add a layer to the top of the group."""
+        self._layers.append(layer)
+
+    def insert(self, index, layer):
+        """Insert a layer at the index."""
+        self._layers.insert(index, layer)
+
+    def index(self, layer):
+        """The index of the layer."""
+        return self._layers.index(layer)
+
+    def pop(self, index=-1):
+        """Remove and return a layer; the top layer by default."""
+        return self._layers.pop(index)
+
+    def remove(self, layer):
+        """Remove the layer."""
+        self._layers.remove(layer)
+
+
+class Display:
+    """A display that renders its root group into a numpy framebuffer. The
+    framebuffer shape is (height, width) in rotated display coordinates."""
+
+    def __init__(self, width, height, *, rotation=0, auto_refresh=True):
+        self._native_width = width
+        self._native_height = height
+        self._rotation = rotation
+        self.auto_refresh = auto_refresh
+        self.brightness = 1.0
+        self.root_group = None
+        self.framebuffer = None
+        self._allocate_framebuffer()
+
+        self.refresh_count = 0
+        self.changed_count = 0  # Refreshes that changed the framebuffer
+        self.refresh_time = 0.0  # Total seconds spent rendering
+        self.refresh_time_max = 0.0  # Longest single render in seconds
+        displays.append(self)
+
+    @property
+    def width(self):
+        """The display width in rotated coordinates."""
+        if self._rotation in (90, 270):
+            return self._native_height
+        return self._native_width
+
+    @property
+    def height(self):
+        """The display height in rotated coordinates."""
+        if self._rotation in (90, 270):
+            return self._native_width
+        return self._native_height
+
+    @property
+    def rotation(self):
+        """The display rotation in degrees."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        self._rotation = value % 360
+        self._allocate_framebuffer()
+
+    def _allocate_framebuffer(self):
+        self.framebuffer = numpy.zeros((self.height, self.width), dtype=numpy.uint32)
+
+    def show(self, group):
+        """Set the root group."""
+        self.root_group = group
+
+    def refresh(self, *, target_frames_per_second=None, minimum_frames_per_second=0):
+        """Render the root group into the framebuffer. Returns True."""
+        start = time.perf_counter()
+        previous = self.framebuffer.copy()
+        self.framebuffer[:, :] = 0
+        if self.root_group is not None:
+            _render(self.root_group, self.framebuffer, 0, 0)
+        elapsed = time.perf_counter() - start
+        self.refresh_count += 1
+        if not numpy.array_equal(previous, self.framebuffer):
+            self.changed_count += 1
+        self.refresh_time += elapsed
+        self.refresh_time_max = max(self.refresh_time_max, elapsed)
+        return True
+
+    def rgb_framebuffer(self):
+        """The framebuffer as a (height, width, 3) uint8 array with display
+        brightness applied."""
+        frame = self.framebuffer
+        rgb = numpy.stack(((frame >> 16) & 0xFF, (frame >> 8) & 0xFF, frame & 0xFF), -1)
+        return (rgb * self.brightness).astype(numpy.uint8)
+
+
+def _render(layer, framebuffer, x_offset, y_offset):
+    """Render a Group or TileGrid layer into the framebuffer."""
+    if getattr(layer, "hidden", False):
+        return
+    x_offset += layer.x
+    y_offset += layer.y
+    if isinstance(layer, Group):
+        for item in layer:
+            _render(item, framebuffer, x_offset, y_offset)
+    elif isinstance(layer, TileGrid):
+        _render_tilegrid(layer, framebuffer, x_offset, y_offset)
+
+
+def _render_tilegrid(grid, framebuffer, x_offset, y_offset):
+    """Render the tiles of a TileGrid into the framebuffer."""
+    shader = grid.pixel_shader
+    if isinstance(shader, Palette):
+        if not len(shader):
+            return
+        # pylint: disable=protected-access
+        colors = numpy.array(shader._colors, dtype=numpy.uint32)
+        opaque = ~numpy.array(shader._transparent, dtype=bool)
+    else:
+        colors = None
+
+    fb_height, fb_width = framebuffer.shape
+    tiles_across = grid.bitmap.width // grid.tile_width
+    for tile_y in range(grid.height):
+        for tile_x in range(grid.width):
+            tile = grid[tile_x, tile_y]
+            src_x = (tile % tiles_across) * grid.tile_width
+            src_y = (tile // tiles_across) * grid.tile_height
+            dst_x = x_offset + (tile_x * grid.tile_width)
+            dst_y = y_offset + (tile_y * grid.tile_height)
+
+            # Clip the tile to the framebuffer
+            x0 = max(0, -dst_x)
+            y0 = max(0, -dst_y)
+            x1 = min(grid.tile_width, fb_width - dst_x)
+            y1 = min(grid.tile_height, fb_height - dst_y)
+            if x0 >= x1 or y0 >= y1:
+                continue
+
+            values = grid.bitmap.data[src_y + y0 : src_y + y1, src_x + x0 : src_x + x1]
+            target = framebuffer[dst_y + y0 : dst_y + y1, dst_x + x0 : dst_x + x1]
+            if colors is None:
+                target[:, :] = values
+            else:
+                values = numpy.minimum(values, len(colors) - 1)
+                mask = opaque[values]
+                target[mask] = colors[values][mask]
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`microcontroller` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython microcontroller module. nvm is an
+8 KB bytearray that persists for the life of the host process; reset() raises
+SystemExit. If the MATRIXWEATHER_NVM environment variable names a file, nvm is
+loaded from the file at import and written back at exit, so that its contents
+survive between runs.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import atexit
+import os
+
+nvm = bytearray(8192)
+
+_NVM_FILE = os.environ.get("MATRIXWEATHER_NVM")
+if _NVM_FILE:
+    if os.path.exists(_NVM_FILE):
+        with open(_NVM_FILE, "rb") as _file:
+            _file.readinto(nvm)
+
+    @atexit.register
+    def _save_nvm():
+        with open(_NVM_FILE, "wb") as file:
+            file.write(nvm)
+
+
+def reset():
+    """Reset the microcontroller; raises SystemExit on the host."""
+    raise SystemExit("microcontroller.reset()")
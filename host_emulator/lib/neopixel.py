@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`neopixel` (host emulator)
+================================================================================
+
+A host-side stand-in for the neopixel library; pixel colors are stored.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+class NeoPixel(list):
+    """A strip of NeoPixels."""
+
+    def __init__(self, pin, n, *, brightness=1.0, auto_write=True, **kwargs):
+        super().__init__([0] * n)
+        self.pin = pin
+        self.brightness = brightness
+        self.auto_write = auto_write
+
+    def fill(self, color):
+        """Set every pixel color."""
+        for index in range(len(self)):
+            self[index] = color
+
+    def show(self):
+        """Update the pixels; ignored."""
+
+    def deinit(self):
+        """Release the pin."""
@@ -0,0 +1,9 @@
+# Host emulator settings; the OpenWeatherMap request is not sent.
+
+secrets = {
+    "ssid": "host",
+    "password": "",
+    "location": "Seattle, WA, US",
+    "timezone": "America/Los_Angeles",
+    "openweather_token": "host",
+}
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`simpleio` (host emulator)
+================================================================================
+
+The simpleio helpers used by the project.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+
+def map_range(x, in_min, in_max, out_min, out_max):
+    """Map a value from one range to another, constrained to the output
+    range."""
+    mapped = (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
+    if out_min <= out_max:
+        return max(min(mapped, out_max), out_min)
+    return min(max(mapped, out_max), out_min)
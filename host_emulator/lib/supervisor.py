@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`supervisor` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython supervisor module.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import time
+
+_START = time.monotonic()
+
+
+class Runtime:  # pylint: disable=too-few-public-methods
+    """Runtime state."""
+
+    serial_connected = True
+    serial_bytes_available = False
+    usb_connected = True
+
+
+runtime = Runtime()
+
+
+def ticks_ms():
+    """Milliseconds since startup, wrapping at 2**29."""
+    return int((time.monotonic() - _START) * 1000) & ((1 << 29) - 1)
+
+
+def set_rgb_status_brightness(brightness):
+    """Set the status NeoPixel brightness; ignored."""
+
+
+def reload():
+    """Reload the code; raises SystemExit on the host."""
+    raise SystemExit("supervisor.reload()")
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`terminalio` (host emulator)
+================================================================================
+
+A host-side stand-in for the CircuitPython terminalio module. FONT is a fixed
+6x12 pixel font; each printable character is drawn as a solid block glyph.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import displayio
+
+
+class Glyph:  # pylint: disable=too-few-public-methods
+    """A font glyph; the bitmap tile index and metrics."""
+
+    def __init__(self, bitmap, tile_index, width, height, dx, dy, shift_x):
+        # pylint: disable=too-many-arguments
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = 0
+
+
+class BuiltinFont:
+    """A fixed-width font with a blank glyph (tile 0) for spaces and a block
+    glyph (tile 1) for all other printable characters."""
+
+    GLYPH_WIDTH = 6
+    GLYPH_HEIGHT = 12
+
+    def __init__(self):
+        self.bitmap = displayio.Bitmap(self.GLYPH_WIDTH * 2, self.GLYPH_HEIGHT, 2)
+        for y in range(2, self.GLYPH_HEIGHT - 3):
+            for x in range(self.GLYPH_WIDTH, (self.GLYPH_WIDTH * 2) - 1):
+                self.bitmap[x, y] = 1
+
+    def get_bounding_box(self):
+        """The font's maximum glyph width and height."""
+        return (self.GLYPH_WIDTH, self.GLYPH_HEIGHT)
+
+    def get_glyph(self, codepoint):
+        """The glyph for a character code point."""
+        tile_index = 0 if codepoint == 0x20 else 1
+        return Glyph(
+            self.bitmap,
+            tile_index,
+            self.GLYPH_WIDTH,
+            self.GLYPH_HEIGHT,
+            0,
+            0,
+            self.GLYPH_WIDTH,
+        )
+
+
+FONT = BuiltinFont()
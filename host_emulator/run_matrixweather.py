@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`run_matrixweather.py`
+================================================================================
+
+Runs a bundle's matrixweather_code.py headless on a host computer using the
+displayio and Matrix Portal stand-ins in host_emulator/lib. Displays are
+rendered into numpy framebuffers by a background auto-refresh thread. After
+the run, frame rate, refresh latency, fetch time, and peak Python heap use are
+reported.
+
+Usage (from the repository root; requires numpy):
+
+  python host_emulator/run_matrixweather.py --bundle bundle_8.0.0 --seconds 10
+
+Add --profile for a cProfile report of the primary code loop and
+--frame frame.ppm to save the final framebuffer image.
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import _thread
+import argparse
+import cProfile
+import os
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def auto_refresh(displayio, frames_per_second, stop):
+    """Refresh all auto-refresh displays at the frame rate until stopped."""
+    while not stop.is_set():
+        for display in displayio.displays:
+            if display.auto_refresh:
+                try:
+                    display.refresh()
+                except (IndexError, RuntimeError):
+                    # The group changed while rendering; skip the frame
+                    pass
+        time.sleep(1 / frames_per_second)
+
+
+def save_frame(display, filename):
+    """Save the display's framebuffer as a binary PPM image."""
+    rgb = display.rgb_framebuffer()
+    with open(filename, "wb") as file:
+        file.write(b"P6 %d %d 255\n" % (rgb.shape[1], rgb.shape[0]))
+        file.write(rgb.tobytes())
+
+
+def main():
+    """Run the module and report the display and heap statistics."""
+    # pylint: disable=too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--bundle", default="bundle_8.0.0")
+    parser.add_argument("--module", default="matrixweather_code.py")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--frame", default=None)
+    args = parser.parse_args()
+
+    bundle_dir = os.path.abspath(os.path.join(HOST_DIR, "..", args.bundle))
+    sys.path[0:0] = [os.path.join(HOST_DIR, "lib"), bundle_dir]
+    os.chdir(bundle_dir)
+
+    import displayio  # pylint: disable=import-outside-toplevel
+
+    stop = threading.Event()
+    refresher = threading.Thread(
+        target=auto_refresh, args=(displayio, args.fps, stop), daemon=True
+    )
+    timer = threading.Timer(args.seconds, _thread.interrupt_main)
+
+    profiler = cProfile.Profile() if args.profile else None
+    tracemalloc.start()
+    start = time.monotonic()
+    refresher.start()
+    timer.start()
+    try:
+        if profiler:
+            profiler.enable()
+        runpy.run_path(args.module, run_name="__main__")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if profiler:
+            profiler.disable()
+        elapsed = time.monotonic() - start
+        timer.cancel()
+        stop.set()
+        refresher.join()
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"\n--- {args.bundle}/{args.module}: {elapsed:.1f} s ---")
+    for index, display in enumerate(displayio.displays):
+        count = max(display.refresh_count, 1)
+        print(
+            f"display {index}: {display.refresh_count} refreshes, "
+            f"{display.changed_count / elapsed:.1f} changed frames/s, "
+            f"render avg {1000 * display.refresh_time / count:.2f} ms, "
+            f"max {1000 * display.refresh_time_max:.2f} ms"
+        )
+    print(f"peak Python heap: {heap_peak / 1024:.1f} KB")
+
+    if args.frame and displayio.displays:
+        save_frame(displayio.displays[-1], args.frame)
+        print(f"framebuffer saved to {args.frame}")
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
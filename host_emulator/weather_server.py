@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+"""
+`weather_server.py`
+================================================================================
+
+A local stand-in for the OpenWeatherMap server that serves recorded responses
+with ETag and Last-Modified validators; Last-Modified is the response's
+observation time. A request with a matching
+If-None-Match or If-Modified-Since header is answered with 304 Not Modified.
+Failures can be injected to check how the fetch path handles them.
+
+Each request serves the next response file in turn after --repeat requests, so
+a list of recorded responses plays back as a changing observation sequence.
+With --fail-every N, every Nth request is answered with 503 Service
+Unavailable; with --truncate-every N, every Nth body is cut off halfway.
+
+Usage (from the repository root):
+
+  python host_emulator/weather_server.py host_emulator/weather_response*.json
+  MATRIXWEATHER_SERVER=localhost:8080 python host_emulator/run_matrixweather.py
+
+* Author(s): JG for Cedar Grove Maker Studios
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class WeatherHandler(BaseHTTPRequestHandler):
+    """Serves the recorded weather responses."""
+
+    protocol_version = "HTTP/1.1"  # Keep connections alive
+
+    recorded = []  # (body, ETag, Last-Modified) of each response file
+    repeat = 1
+    fail_every = 0
+    truncate_every = 0
+    request_count = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer a weather query."""
+        cls = WeatherHandler
+        cls.request_count += 1
+        count = cls.request_count
+        if cls.fail_every and not count % cls.fail_every:
+            self.send_error(503)
+            return
+
+        index = min((count - 1) // cls.repeat, len(cls.recorded) - 1)
+        body, etag, last_modified = cls.recorded[index]
+        # If-None-Match takes precedence over If-Modified-Since
+        if_none_match = self.headers.get("If-None-Match")
+        if (if_none_match is not None and if_none_match == etag) or (
+            if_none_match is None
+            and self.headers.get("If-Modified-Since") == last_modified
+        ):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        if cls.truncate_every and not count % cls.truncate_every:
+            body = body[: len(body) // 2]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    """Serve the recorded responses until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "responses",
+        nargs="*",
+        default=[os.path.join(HOST_DIR, "weather_response.json")],
+    )
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--fail-every", type=int, default=0)
+    parser.add_argument("--truncate-every", type=int, default=0)
+    args = parser.parse_args()
+
+    for path in args.responses:
+        with open(path, "rb") as file:
+            body = file.read()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        # The observation time of the recorded response
+        last_modified = formatdate(json.loads(body)["dt"], usegmt=True)
+        WeatherHandler.recorded.append((body, etag, last_modified))
+    WeatherHandler.repeat = max(1, args.repeat)
+    WeatherHandler.fail_every = args.fail_every
+    WeatherHandler.truncate_every = args.truncate_every
+
+    server = HTTPServer(("localhost", args.port), WeatherHandler)
+    print(f"Serving {len(WeatherHandler.recorded)} responses on port {args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()